@@ -3,7 +3,9 @@ Optimized AI prompt system for sexual health education.
 """
 
 import re
-from typing import Dict, Optional
+from functools import cache, lru_cache
+from types import MappingProxyType
+from typing import ClassVar, Mapping, Optional, Tuple
 from enum import Enum
 
 class PromptType(Enum):
@@ -11,66 +13,114 @@ class PromptType(Enum):
     SAFETY = "safety"
     MEDICAL = "medical"
 
+
+_CJK_PATTERN = re.compile(r'[\u4e00-\u9fff]')
+
+
+@lru_cache(maxsize=1024)
+def _detect_language(text: str) -> str:
+    """Detect if text is Chinese or English, memoized on the raw text."""
+    return "zh-CN" if _CJK_PATTERN.search(text) else "en"
+
+
+_PROMPTS = MappingProxyType({
+    "en": MappingProxyType({
+        PromptType.BASIC: (
+            "You are a professional sexual health educator. "
+            "Provide accurate, age-appropriate information about: {topic}. "
+            "Question: {question}"
+        ),
+        PromptType.SAFETY: (
+            "You are a sexual health educator focused on safety. "
+            "Address this safety concern with practical advice: {question}. "
+            "Emphasize protection and professional consultation when needed."
+        ),
+        PromptType.MEDICAL: (
+            "You are a sexual health educator. This question may require medical advice: {question}. "
+            "Provide general information and strongly recommend consulting a healthcare provider."
+        )
+    }),
+    "zh-CN": MappingProxyType({
+        PromptType.BASIC: (
+            "您是专业的性健康教育工作者。"
+            "请提供关于{topic}的准确、适龄信息。"
+            "问题：{question}"
+        ),
+        PromptType.SAFETY: (
+            "您是专注于安全的性健康教育工作者。"
+            "请针对此安全问题提供实用建议：{question}。"
+            "强调保护措施和必要时的专业咨询。"
+        ),
+        PromptType.MEDICAL: (
+            "您是性健康教育工作者。此问题可能需要医疗建议：{question}。"
+            "请提供一般信息并强烈建议咨询医疗专业人员。"
+        )
+    })
+})
+
+# Flat (language, prompt type) table so lookups are a single probe.
+_TEMPLATES = MappingProxyType({
+    (language, prompt_type): template
+    for language, templates in _PROMPTS.items()
+    for prompt_type, template in templates.items()
+})
+
+_QUALITY_GUIDES = MappingProxyType({
+    "en": (
+        "\n\nEnsure your response is: 1) Scientifically accurate "
+        "2) Culturally sensitive 3) Age-appropriate 4) Non-judgmental"
+    ),
+    "zh-CN": (
+        "\n\n请确保回答：1) 科学准确 2) 文化敏感 3) 年龄适宜 4) 非评判性"
+    )
+})
+
+# Quality guidelines are fixed per language, so fold them into the
+# templates once instead of concatenating on every request.
+_ENHANCED_TEMPLATES = MappingProxyType({
+    key: template + _QUALITY_GUIDES[key[0]]
+    for key, template in _TEMPLATES.items()
+})
+
+_TOPICS = MappingProxyType({
+    "contraception": ("birth control", "condom", "pill", "避孕", "安全套"),
+    "anatomy": ("body", "menstrual", "reproductive", "身体", "月经", "生殖"),
+    "safety": ("safe", "protection", "risk", "安全", "保护", "风险"),
+    "relationship": ("partner", "communication", "伴侣", "沟通"),
+    "sti": ("infection", "disease", "hiv", "性病", "感染", "艾滋"),
+    "consent": ("consent", "permission", "同意", "许可")
+})
+
+_MEDICAL_KEYWORDS = (
+    "diagnose", "treatment", "medication", "doctor", "pain", "symptoms",
+    "诊断", "治疗", "药物", "医生", "疼痛", "症状"
+)
+
+_SAFETY_KEYWORDS = (
+    "unsafe", "dangerous", "risky", "harmful", "abuse",
+    "不安全", "危险", "有害", "虐待"
+)
+
+
 class PromptEngine:
+    # Template and keyword tables are read-only module constants shared by
+    # every engine; instances cannot modify them.
+    prompts: ClassVar[Mapping[str, Mapping[PromptType, str]]] = _PROMPTS
+    quality_guides: ClassVar[Mapping[str, str]] = _QUALITY_GUIDES
+    topics: ClassVar[Mapping[str, Tuple[str, ...]]] = _TOPICS
+    medical_keywords: ClassVar[Tuple[str, ...]] = _MEDICAL_KEYWORDS
+    safety_keywords: ClassVar[Tuple[str, ...]] = _SAFETY_KEYWORDS
+    _templates: ClassVar[Mapping[Tuple[str, PromptType], str]] = _TEMPLATES
+    _enhanced_templates: ClassVar[Mapping[Tuple[str, PromptType], str]] = _ENHANCED_TEMPLATES
+
     def __init__(self):
-        self.prompts = {
-            "en": {
-                PromptType.BASIC: (
-                    "You are a professional sexual health educator. "
-                    "Provide accurate, age-appropriate information about: {topic}. "
-                    "Question: {question}"
-                ),
-                PromptType.SAFETY: (
-                    "You are a sexual health educator focused on safety. "
-                    "Address this safety concern with practical advice: {question}. "
-                    "Emphasize protection and professional consultation when needed."
-                ),
-                PromptType.MEDICAL: (
-                    "You are a sexual health educator. This question may require medical advice: {question}. "
-                    "Provide general information and strongly recommend consulting a healthcare provider."
-                )
-            },
-            "zh-CN": {
-                PromptType.BASIC: (
-                    "您是专业的性健康教育工作者。"
-                    "请提供关于{topic}的准确、适龄信息。"
-                    "问题：{question}"
-                ),
-                PromptType.SAFETY: (
-                    "您是专注于安全的性健康教育工作者。"
-                    "请针对此安全问题提供实用建议：{question}。"
-                    "强调保护措施和必要时的专业咨询。"
-                ),
-                PromptType.MEDICAL: (
-                    "您是性健康教育工作者。此问题可能需要医疗建议：{question}。"
-                    "请提供一般信息并强烈建议咨询医疗专业人员。"
-                )
-            }
-        }
-        
-        self.topics = {
-            "contraception": ["birth control", "condom", "pill", "避孕", "安全套"],
-            "anatomy": ["body", "menstrual", "reproductive", "身体", "月经", "生殖"],
-            "safety": ["safe", "protection", "risk", "安全", "保护", "风险"],
-            "relationship": ["partner", "communication", "伴侣", "沟通"],
-            "sti": ["infection", "disease", "hiv", "性病", "感染", "艾滋"],
-            "consent": ["consent", "permission", "同意", "许可"]
-        }
-        
-        self.medical_keywords = [
-            "diagnose", "treatment", "medication", "doctor", "pain", "symptoms",
-            "诊断", "治疗", "药物", "医生", "疼痛", "症状"
-        ]
-        
-        self.safety_keywords = [
-            "unsafe", "dangerous", "risky", "harmful", "abuse",
-            "不安全", "危险", "有害", "虐待"
-        ]
+        # Exact-match cache of rendered prompts; repeated questions skip
+        # language detection, classification and formatting entirely.
+        self._prompt_cache = lru_cache(maxsize=1024)(self._render)
 
     def detect_language(self, text: str) -> str:
         """Detect if text is Chinese or English."""
-        chinese_chars = len(re.findall(r'[\u4e00-\u9fff]', text))
-        return "zh-CN" if chinese_chars > 0 else "en"
+        return _detect_language(text)
 
     def classify_topic(self, text: str) -> str:
         """Classify the main topic of the question."""
@@ -94,13 +144,14 @@ class PromptEngine:
         
         return PromptType.BASIC
 
-    def generate_prompt(self, question: str, context: Optional[str] = None) -> str:
-        """Generate optimized prompt for the question."""
+    def _render(self, enhanced: bool, question: str, context: Optional[str]) -> str:
+        """Select a template from the plain or enhanced table and fill it in."""
+        templates = self._enhanced_templates if enhanced else self._templates
         language = self.detect_language(question)
         topic = self.classify_topic(question)
         prompt_type = self.determine_prompt_type(question)
         
-        template = self.prompts[language][prompt_type]
+        template = templates[(language, prompt_type)]
         
         return template.format(
             question=question,
@@ -108,19 +159,16 @@ class PromptEngine:
             context=context or ""
         )
 
+    def generate_prompt(self, question: str, context: Optional[str] = None) -> str:
+        """Generate optimized prompt for the question."""
+        return self._prompt_cache(False, question, context)
+
     def enhance_response_quality(self, question: str) -> str:
         """Add response quality guidelines to prompt."""
-        language = self.detect_language(question)
-        base_prompt = self.generate_prompt(question)
-        
-        if language == "zh-CN":
-            quality_guide = (
-                "\n\n请确保回答：1) 科学准确 2) 文化敏感 3) 年龄适宜 4) 非评判性"
-            )
-        else:
-            quality_guide = (
-                "\n\nEnsure your response is: 1) Scientifically accurate "
-                "2) Culturally sensitive 3) Age-appropriate 4) Non-judgmental"
-            )
-        
-        return base_prompt + quality_guide
\ No newline at end of file
+        return self._prompt_cache(True, question, None)
+
+
+@cache
+def get_prompt_engine() -> PromptEngine:
+    """Return the process-wide prompt engine shared by the backend services."""
+    return PromptEngine()
@@ -3,6 +3,7 @@ from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
+from sqlalchemy.engine import make_url
 
 from alembic import context
 
@@ -30,6 +31,21 @@ target_metadata = Base.metadata
 def get_url():
     return settings.SQLALCHEMY_DATABASE_URI
 
+
+def get_engine_options(url) -> dict:
+    """Batch executemany for data migrations when running on psycopg2.
+
+    psycopg (v3) and other drivers do not accept these options, so they
+    keep their defaults.
+    """
+    if make_url(url).get_dialect().driver != "psycopg2":
+        return {}
+    return {
+        "executemany_mode": "values_plus_batch",
+        "insertmanyvalues_page_size": 1000,
+        "executemany_batch_page_size": 500,
+    }
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -67,6 +83,7 @@ def run_migrations_online() -> None:
         configuration,
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        **get_engine_options(configuration["sqlalchemy.url"]),
     )
 
     with connectable.connect() as connection:
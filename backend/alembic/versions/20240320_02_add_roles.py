@@ -53,29 +53,29 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('role', 'permission_id')
     )
     
-    # Insert default permissions
-    op.bulk_insert(
-        sa.table('permissions',
-            sa.column('name', sa.String),
-            sa.column('description', sa.String)
-        ),
-        [
+    # Insert default permissions as one multi-row INSERT ... VALUES
+    permissions = sa.table('permissions',
+        sa.column('name', sa.String),
+        sa.column('description', sa.String)
+    )
+    op.execute(
+        permissions.insert().values([
             {'name': 'manage_users', 'description': 'Manage user accounts'},
             {'name': 'manage_chats', 'description': 'Manage chat rooms'},
             {'name': 'manage_messages', 'description': 'Manage messages'},
             {'name': 'view_analytics', 'description': 'View analytics'},
             {'name': 'manage_settings', 'description': 'Manage system settings'}
-        ]
+        ])
     )
     
     # Insert default role permissions
-    op.bulk_insert(
-        sa.table('role_permissions',
-            sa.column('role', sa.Enum('admin', 'moderator', 'user', 
-                                    name='user_role')),
-            sa.column('permission_id', sa.Integer)
-        ),
-        [
+    role_permissions = sa.table('role_permissions',
+        sa.column('role', sa.Enum('admin', 'moderator', 'user', 
+                                name='user_role')),
+        sa.column('permission_id', sa.Integer)
+    )
+    op.execute(
+        role_permissions.insert().values([
             # Admin permissions
             {'role': 'admin', 'permission_id': 1},
             {'role': 'admin', 'permission_id': 2},
@@ -89,7 +89,7 @@ def upgrade() -> None:
             # User permissions
             {'role': 'user', 'permission_id': 2},
             {'role': 'user', 'permission_id': 3}
-        ]
+        ])
     )
 
 
@@ -19,40 +19,21 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add security-related columns to users table
-    op.add_column('users',
-        sa.Column('failed_login_attempts', sa.Integer(), nullable=False, 
-                 server_default='0')
-    )
-    op.add_column('users',
-        sa.Column('last_failed_login', sa.DateTime(), nullable=True)
-    )
-    op.add_column('users',
-        sa.Column('password_changed_at', sa.DateTime(), nullable=True)
-    )
-    op.add_column('users',
-        sa.Column('email_verified', sa.Boolean(), nullable=False, 
-                 server_default='false')
-    )
-    op.add_column('users',
-        sa.Column('email_verification_token', sa.String(), nullable=True)
-    )
-    op.add_column('users',
-        sa.Column('email_verification_sent_at', sa.DateTime(), nullable=True)
-    )
-    op.add_column('users',
-        sa.Column('password_reset_token', sa.String(), nullable=True)
-    )
-    op.add_column('users',
-        sa.Column('password_reset_sent_at', sa.DateTime(), nullable=True)
-    )
-    op.add_column('users',
-        sa.Column('two_factor_enabled', sa.Boolean(), nullable=False, 
-                 server_default='false')
-    )
-    op.add_column('users',
-        sa.Column('two_factor_secret', sa.String(), nullable=True)
-    )
+    # Add security-related columns to users table in a single ALTER TABLE,
+    # so the lock is taken and the catalog updated once
+    op.execute("""
+        ALTER TABLE users
+            ADD COLUMN failed_login_attempts INTEGER NOT NULL DEFAULT 0,
+            ADD COLUMN last_failed_login TIMESTAMP WITHOUT TIME ZONE,
+            ADD COLUMN password_changed_at TIMESTAMP WITHOUT TIME ZONE,
+            ADD COLUMN email_verified BOOLEAN NOT NULL DEFAULT false,
+            ADD COLUMN email_verification_token VARCHAR,
+            ADD COLUMN email_verification_sent_at TIMESTAMP WITHOUT TIME ZONE,
+            ADD COLUMN password_reset_token VARCHAR,
+            ADD COLUMN password_reset_sent_at TIMESTAMP WITHOUT TIME ZONE,
+            ADD COLUMN two_factor_enabled BOOLEAN NOT NULL DEFAULT false,
+            ADD COLUMN two_factor_secret VARCHAR
+    """)
     
     # Create login_history table
     op.create_table(
@@ -179,14 +160,18 @@ def downgrade() -> None:
     op.drop_table('security_logs')
     op.drop_table('login_history')
     
-    # Drop columns from users table
-    op.drop_column('users', 'two_factor_secret')
-    op.drop_column('users', 'two_factor_enabled')
-    op.drop_column('users', 'password_reset_sent_at')
-    op.drop_column('users', 'password_reset_token')
-    op.drop_column('users', 'email_verification_sent_at')
-    op.drop_column('users', 'email_verification_token')
-    op.drop_column('users', 'email_verified')
-    op.drop_column('users', 'password_changed_at')
-    op.drop_column('users', 'last_failed_login')
-    op.drop_column('users', 'failed_login_attempts') 
\ No newline at end of file
+    # Drop columns from users table in a single ALTER TABLE, mirroring
+    # upgrade()
+    op.execute("""
+        ALTER TABLE users
+            DROP COLUMN two_factor_secret,
+            DROP COLUMN two_factor_enabled,
+            DROP COLUMN password_reset_sent_at,
+            DROP COLUMN password_reset_token,
+            DROP COLUMN email_verification_sent_at,
+            DROP COLUMN email_verification_token,
+            DROP COLUMN email_verified,
+            DROP COLUMN password_changed_at,
+            DROP COLUMN last_failed_login,
+            DROP COLUMN failed_login_attempts
+    """)
@@ -0,0 +1,51 @@
+"""Add composite indexes for login history and security log lookups
+
+Revision ID: 20250903_add_security_composite_indexes
+Revises: 20250902_add_knowledge_system
+Create Date: 2025-09-03 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250903_add_security_composite_indexes'
+down_revision: Union[str, None] = '20250902_add_knowledge_system'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # These tables already hold data, so build the indexes concurrently
+    # (outside the migration transaction) to avoid blocking writers.
+    with op.get_context().autocommit_block():
+        # Per-user recent attempts: WHERE user_id = ? AND success = ?
+        # ORDER BY login_at DESC
+        op.create_index('ix_login_history_user_success_time', 'login_history',
+                       ['user_id', 'success', sa.text('login_at DESC')],
+                       unique=False, postgresql_concurrently=True)
+        op.create_index('ix_security_logs_user_action_time', 'security_logs',
+                       ['user_id', 'action', sa.text('created_at DESC')],
+                       unique=False, postgresql_concurrently=True)
+
+        # The single-column user_id indexes are prefixes of the composite
+        # ones. login_at and action stay indexed on their own for
+        # cross-user queries.
+        op.drop_index('ix_login_history_user_id', table_name='login_history',
+                     postgresql_concurrently=True)
+        op.drop_index('ix_security_logs_user_id', table_name='security_logs',
+                     postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_security_logs_user_id', 'security_logs',
+                       ['user_id'], unique=False, postgresql_concurrently=True)
+        op.create_index('ix_login_history_user_id', 'login_history',
+                       ['user_id'], unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_security_logs_user_action_time',
+                     table_name='security_logs', postgresql_concurrently=True)
+        op.drop_index('ix_login_history_user_success_time',
+                     table_name='login_history', postgresql_concurrently=True)
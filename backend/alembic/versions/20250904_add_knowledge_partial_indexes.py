@@ -0,0 +1,40 @@
+"""Replace the knowledge_entries is_active index with a partial index
+
+Revision ID: 20250904_add_knowledge_partial_indexes
+Revises: 20250903_add_security_composite_indexes
+Create Date: 2025-09-04 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20250904_add_knowledge_partial_indexes'
+down_revision: Union[str, None] = '20250903_add_security_composite_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Entry listings always filter on is_active = true, optionally by
+        # category and language; inactive rows never need to be indexed.
+        op.create_index('ix_knowledge_entries_active_cat_lang', 'knowledge_entries',
+                       ['category', 'language'], unique=False,
+                       postgresql_where=sa.text('is_active'),
+                       postgresql_concurrently=True)
+        op.drop_index('ix_knowledge_entries_is_active',
+                     table_name='knowledge_entries',
+                     postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_knowledge_entries_is_active', 'knowledge_entries',
+                       ['is_active'], unique=False,
+                       postgresql_concurrently=True)
+        op.drop_index('ix_knowledge_entries_active_cat_lang',
+                     table_name='knowledge_entries',
+                     postgresql_concurrently=True)
@@ -0,0 +1,32 @@
+"""Index knowledge_entries by title and language
+
+Revision ID: 20250905_add_knowledge_title_index
+Revises: 20250904_add_knowledge_partial_indexes
+Create Date: 2025-09-05 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20250905_add_knowledge_title_index'
+down_revision: Union[str, None] = '20250904_add_knowledge_partial_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Knowledge updates look up each generated entry by
+        # (title, language) before deciding to insert or update it.
+        op.create_index('ix_knowledge_entries_title_language', 'knowledge_entries',
+                       ['title', 'language'], unique=False,
+                       postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_knowledge_entries_title_language',
+                     table_name='knowledge_entries',
+                     postgresql_concurrently=True)
@@ -0,0 +1,51 @@
+"""Drop the password policy trigger on users
+
+Revision ID: 20250906_drop_password_policy_trigger
+Revises: 20250905_add_knowledge_title_index
+Create Date: 2025-09-06 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20250906_drop_password_policy_trigger'
+down_revision: Union[str, None] = '20250905_add_knowledge_title_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The trigger ran five regex scans over hashed_password on every write.
+    # It only ever saw the bcrypt hash, never the plaintext, so it enforced
+    # nothing.
+    op.execute("DROP TRIGGER IF EXISTS check_password_policy_trigger ON users")
+    op.execute("DROP FUNCTION IF EXISTS check_password_policy()")
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION check_password_policy()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF NEW.hashed_password IS NOT NULL AND (
+                LENGTH(NEW.hashed_password) < 8 OR
+                NEW.hashed_password !~ '[A-Z]' OR
+                NEW.hashed_password !~ '[a-z]' OR
+                NEW.hashed_password !~ '[0-9]' OR
+                NEW.hashed_password !~ '[^A-Za-z0-9]'
+            ) THEN
+                RAISE EXCEPTION 'Password does not meet security requirements';
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute("""
+        CREATE TRIGGER check_password_policy_trigger
+        BEFORE INSERT OR UPDATE OF hashed_password ON users
+        FOR EACH ROW
+        EXECUTE FUNCTION check_password_policy();
+    """)
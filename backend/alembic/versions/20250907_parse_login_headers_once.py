@@ -0,0 +1,68 @@
+"""Parse request headers once per row in the login attempt trigger
+
+Revision ID: 20250907_parse_login_headers_once
+Revises: 20250906_drop_password_policy_trigger
+Create Date: 2025-09-07 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20250907_parse_login_headers_once'
+down_revision: Union[str, None] = '20250906_drop_password_policy_trigger'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The trigger itself is unchanged; only the function body is replaced,
+    # so request.headers is cast to json once instead of once per field.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION log_login_attempt()
+        RETURNS TRIGGER AS $$
+        DECLARE
+            headers json := current_setting('request.headers')::json;
+        BEGIN
+            INSERT INTO login_history (
+                user_id, ip_address, user_agent, success, failure_reason
+            ) VALUES (
+                NEW.id,
+                headers->>'x-forwarded-for',
+                headers->>'user-agent',
+                NEW.failed_login_attempts = 0,
+                CASE
+                    WHEN NEW.failed_login_attempts > 0
+                    THEN 'Invalid credentials'
+                    ELSE NULL
+                END
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION log_login_attempt()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            INSERT INTO login_history (
+                user_id, ip_address, user_agent, success, failure_reason
+            ) VALUES (
+                NEW.id,
+                current_setting('request.headers')::json->>'x-forwarded-for',
+                current_setting('request.headers')::json->>'user-agent',
+                NEW.failed_login_attempts = 0,
+                CASE
+                    WHEN NEW.failed_login_attempts > 0
+                    THEN 'Invalid credentials'
+                    ELSE NULL
+                END
+            );
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
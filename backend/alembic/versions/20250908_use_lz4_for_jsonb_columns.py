@@ -0,0 +1,53 @@
+"""Use LZ4 TOAST compression for JSONB columns
+
+Revision ID: 20250908_use_lz4_for_jsonb_columns
+Revises: 20250907_parse_login_headers_once
+Create Date: 2025-09-08 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20250908_use_lz4_for_jsonb_columns'
+down_revision: Union[str, None] = '20250907_parse_login_headers_once'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Per-column compression needs PostgreSQL 14+ built with lz4; both show
+    # up as an 'lz4' choice for default_toast_compression. Older or non-lz4
+    # servers keep pglz. Only newly written values are recompressed.
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_settings
+                WHERE name = 'default_toast_compression'
+                AND 'lz4' = ANY(enumvals)
+            ) THEN
+                ALTER TABLE users
+                    ALTER COLUMN preferences SET COMPRESSION lz4,
+                    ALTER COLUMN settings SET COMPRESSION lz4;
+                ALTER TABLE security_logs
+                    ALTER COLUMN details SET COMPRESSION lz4;
+            END IF;
+        END $$;
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        DO $$
+        BEGIN
+            IF current_setting('server_version_num')::int >= 140000 THEN
+                ALTER TABLE users
+                    ALTER COLUMN preferences SET COMPRESSION default,
+                    ALTER COLUMN settings SET COMPRESSION default;
+                ALTER TABLE security_logs
+                    ALTER COLUMN details SET COMPRESSION default;
+            END IF;
+        END $$;
+    """)
@@ -2,21 +2,33 @@
 FastAPI routes for AI functionality in the LLB application.
 """
 
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import re
+import uuid
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     File,
     Form,
     HTTPException,
     UploadFile,
 )
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 import logging
 logger = logging.getLogger(__name__)
 from pydantic import BaseModel, Field
 
 from app.api import deps
+from app.core.config import settings
+from services.language import CJK_PATTERN
 from app.services.audio_service import AudioService
 from app.core.exceptions import (
     AudioFormatException,
@@ -26,7 +38,21 @@ from app.core.exceptions import (
 )
 
 # Create router
-router = APIRouter(prefix="/api/ai", tags=["AI"])
+router = APIRouter(
+    prefix="/api/ai", tags=["AI"], default_response_class=ORJSONResponse
+)
+
+# Latin letters; CJK_PATTERN comes from services.language
+_LATIN_PATTERN = re.compile(r"[A-Za-z]")
+
+# Every PDF file starts with this signature
+PDF_MAGIC = b"%PDF-"
+
+# Upper bound on items accepted by the batch endpoints
+MAX_BATCH_SIZE = 64
+
+# Synthesized speech is written here; StorageService creates the directory
+TTS_AUDIO_DIR = settings.UPLOAD_DIR / "audio"
 
 # Placeholder for AI functionality
 def get_ai_service():
@@ -60,6 +86,17 @@ class TextGenerationResponse(BaseModel):
     generated_text: str = Field(..., description="Generated text")
 
 
+class BatchTextGenerationRequest(BaseModel):
+    """Request model for batched text generation."""
+
+    prompts: List[TextGenerationRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="Text generation requests to run together",
+    )
+
+
 class ChatMessage(BaseModel):
     """Chat message model."""
 
@@ -81,6 +118,17 @@ class ChatResponse(BaseModel):
     response: str = Field(..., description="Chat response")
 
 
+class BatchChatRequest(BaseModel):
+    """Request model for batched chat completion."""
+
+    conversations: List[ChatRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="Chat requests to run together",
+    )
+
+
 class LanguageDetectionRequest(BaseModel):
     """Request model for language detection."""
 
@@ -97,6 +145,26 @@ class LanguageDetectionResponse(BaseModel):
     )
 
 
+class BatchLanguageDetectionRequest(BaseModel):
+    """Request model for batched language detection."""
+
+    texts: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_SIZE,
+        description="Texts to detect languages from",
+    )
+
+
+class TranscriptSegment(BaseModel):
+    """A timed segment of a transcription."""
+
+    start: float = Field(..., description="Segment start in seconds")
+    end: float = Field(..., description="Segment end in seconds")
+    text: str = Field(..., description="Segment text")
+    confidence: float = Field(..., description="Segment confidence score")
+
+
 class TranscriptionResponse(BaseModel):
     """Response model for transcription."""
 
@@ -104,7 +172,7 @@ class TranscriptionResponse(BaseModel):
     language: str = Field(..., description="Detected or specified language")
     confidence: float = Field(..., description="Transcription confidence score")
     duration: float = Field(..., description="Audio duration in seconds")
-    segments: List[Dict[str, Any]] = Field(default=[], description="Transcription segments")
+    segments: List[TranscriptSegment] = Field(default=[], description="Transcription segments")
     filename: Optional[str] = Field(None, description="Original filename")
 
 
@@ -164,6 +232,55 @@ class ModelSettingsResponse(BaseModel):
     useQuantization: bool = Field(..., description="Whether to use quantization")
 
 
+# === Helpers ===
+
+
+def _tts_filename(
+    text: str, language: Optional[str], voice_settings: Optional[Dict[str, Any]]
+) -> str:
+    """
+    Build a stable but unguessable file name for synthesized speech.
+
+    Speech synthesis is deterministic for the same text, language and voice
+    settings, so those inputs name the file. They are keyed with an HMAC
+    over SECRET_KEY so nobody can hash a phrase and probe for its audio.
+
+    Returns:
+        str: File name of the form ``tts_<hmac-sha256>.wav``
+    """
+    key = json.dumps(
+        [text, language, voice_settings], sort_keys=True, ensure_ascii=False
+    )
+    digest = hmac.new(
+        settings.SECRET_KEY.encode("utf-8"), key.encode("utf-8"), hashlib.sha256
+    ).hexdigest()
+    return f"tts_{digest}.wav"
+
+
+def _quick_detect_language(text: str) -> Dict[str, Any]:
+    """
+    Classify text as Chinese or English by script.
+
+    Any CJK character marks the text as Chinese, matching the chat
+    services, so mixed input such as "HPV疫苗" is not labelled English.
+
+    Returns:
+        dict: Language code, confidence and support flag
+    """
+    if CJK_PATTERN.search(text):
+        return {"language": "zh", "confidence": 0.95, "supported": True}
+    if _LATIN_PATTERN.search(text):
+        return {"language": "en", "confidence": 0.95, "supported": True}
+    return {"language": "en", "confidence": 0.5, "supported": True}
+
+
+def _write_file_atomic(path: Path, data: bytes) -> None:
+    """Write data next to path and rename it into place."""
+    temp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+
+
 # === API Routes ===
 
 
@@ -177,18 +294,18 @@ async def get_model_status():
     """
     try:
         # Return mock status for now
-        return ModelStatusResponse(
-            status="ready",
-            modelName="Gemma 4 Health Tuned",
-            lastUpdated=None
-        )
+        return {
+            "status": "ready",
+            "modelName": "Gemma 4 Health Tuned",
+            "lastUpdated": None,
+        }
     except Exception as e:
         logger.error(f"Model status check error: {str(e)}")
-        return ModelStatusResponse(
-            status="error",
-            modelName="Gemma 4 Health Tuned",
-            lastUpdated=None
-        )
+        return {
+            "status": "error",
+            "modelName": "Gemma 4 Health Tuned",
+            "lastUpdated": None,
+        }
 
 
 @router.get("/model/settings", response_model=ModelSettingsResponse)
@@ -201,13 +318,13 @@ async def get_model_settings():
     """
     try:
         # Return default settings for now
-        return ModelSettingsResponse(
-            temperature=0.7,
-            maxTokens=2048,
-            topP=0.95,
-            topK=40,
-            useQuantization=True
-        )
+        return {
+            "temperature": 0.7,
+            "maxTokens": 2048,
+            "topP": 0.95,
+            "topK": 40,
+            "useQuantization": True,
+        }
     except Exception as e:
         logger.error(f"Model settings fetch error: {str(e)}")
         raise HTTPException(
@@ -231,13 +348,13 @@ async def update_model_settings(
     try:
         # For now, just return the settings that were sent
         # In a real implementation, these would be saved and applied to the model
-        return ModelSettingsResponse(
-            temperature=request.temperature,
-            maxTokens=request.maxTokens,
-            topP=request.topP,
-            topK=request.topK,
-            useQuantization=request.useQuantization
-        )
+        return {
+            "temperature": request.temperature,
+            "maxTokens": request.maxTokens,
+            "topP": request.topP,
+            "topK": request.topK,
+            "useQuantization": request.useQuantization,
+        }
     except Exception as e:
         logger.error(f"Model settings update error: {str(e)}")
         raise HTTPException(
@@ -261,7 +378,7 @@ async def generate_text(
     try:
         # Mock response for now
         generated_text = f"Mock response to: {request.prompt[:50]}..."
-        return TextGenerationResponse(generated_text=generated_text)
+        return {"generated_text": generated_text}
 
     except Exception as e:
         logger.error(f"Text generation error: {str(e)}")
@@ -270,6 +387,24 @@ async def generate_text(
         )
 
 
+@router.post("/generate/batch", response_model=List[TextGenerationResponse])
+async def generate_text_batch(
+    request: BatchTextGenerationRequest,
+):
+    """
+    Generate text for several prompts in one request.
+
+    Args:
+        request: Text generation requests, at most MAX_BATCH_SIZE
+
+    Returns:
+        List[TextGenerationResponse]: Generated texts in request order
+    """
+    return await asyncio.gather(
+        *(generate_text(prompt) for prompt in request.prompts)
+    )
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat_completion(
     request: ChatRequest
@@ -288,7 +423,7 @@ async def chat_completion(
         last_message = request.messages[-1].content if request.messages else "Hello"
         response = f"Mock AI response to: {last_message[:50]}..."
 
-        return ChatResponse(response=response)
+        return {"response": response}
 
     except Exception as e:
         logger.error(f"Chat completion error: {str(e)}")
@@ -297,6 +432,24 @@ async def chat_completion(
         )
 
 
+@router.post("/chat/batch", response_model=List[ChatResponse])
+async def chat_completion_batch(
+    request: BatchChatRequest
+):
+    """
+    Generate responses for several conversations in one request.
+
+    Args:
+        request: Chat requests, at most MAX_BATCH_SIZE
+
+    Returns:
+        List[ChatResponse]: Chat responses in request order
+    """
+    return await asyncio.gather(
+        *(chat_completion(conversation) for conversation in request.conversations)
+    )
+
+
 @router.post("/detect-language", response_model=LanguageDetectionResponse)
 async def detect_language(
     request: LanguageDetectionRequest,
@@ -311,12 +464,7 @@ async def detect_language(
         LanguageDetectionResponse: The detected language
     """
     try:
-        # Mock language detection
-        return LanguageDetectionResponse(
-            language="en",
-            confidence=0.95,
-            supported=True,
-        )
+        return _quick_detect_language(request.text)
 
     except Exception as e:
         logger.error(f"Language detection error: {str(e)}")
@@ -325,8 +473,32 @@ async def detect_language(
         )
 
 
+@router.post(
+    "/detect-language/batch", response_model=List[LanguageDetectionResponse]
+)
+async def detect_language_batch(
+    request: BatchLanguageDetectionRequest,
+):
+    """
+    Detect the languages of several texts in one request.
+
+    Args:
+        request: Texts to detect, at most MAX_BATCH_SIZE
+
+    Returns:
+        List[LanguageDetectionResponse]: Detected languages in request order
+    """
+    return await asyncio.gather(
+        *(
+            detect_language(LanguageDetectionRequest(text=text))
+            for text in request.texts
+        )
+    )
+
+
 @router.post("/transcribe", response_model=TranscriptionResponse)
 async def transcribe_audio(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     language: Optional[str] = Form(None),
     audio_service: AudioService = Depends(deps.get_audio_service),
@@ -335,6 +507,7 @@ async def transcribe_audio(
     Transcribe audio from an uploaded file using Whisper.
 
     Args:
+        background_tasks: Tasks run after the response is sent
         file: Audio file (wav, mp3, m4a, ogg, flac, aac)
         language: Optional language code (zh, en, auto)
         audio_service: Audio service dependency
@@ -343,8 +516,6 @@ async def transcribe_audio(
         TranscriptionResponse: The transcription result with confidence and segments
     """
     try:
-        logger.info(f"Transcribing audio file: {file.filename}")
-        
         # Validate file
         if not file.filename:
             raise HTTPException(status_code=400, detail="No filename provided")
@@ -358,15 +529,21 @@ async def transcribe_audio(
         
         # Use the audio service's file transcription method
         result = await audio_service.transcribe_upload_file(file, language)
-        
-        return TranscriptionResponse(
-            text=result["text"],
-            language=result["language"],
-            confidence=result["confidence"],
-            duration=result["duration"],
-            segments=result["segments"],
-            filename=result.get("filename")
+        background_tasks.add_task(
+            logger.info,
+            "Transcribed audio file %s: %d chars",
+            file.filename,
+            len(result["text"]),
         )
+        
+        return {
+            "text": result["text"],
+            "language": result["language"],
+            "confidence": result["confidence"],
+            "duration": result["duration"],
+            "segments": result["segments"],
+            "filename": result.get("filename"),
+        }
 
     except AudioFormatException as e:
         logger.warning(f"Audio format error: {str(e)}")
@@ -387,6 +564,7 @@ async def transcribe_audio(
 @router.post("/text-to-speech", response_model=TextToSpeechResponse)
 async def text_to_speech(
     request: TextToSpeechRequest,
+    background_tasks: BackgroundTasks,
     audio_service: AudioService = Depends(deps.get_audio_service),
 ):
     """
@@ -394,14 +572,13 @@ async def text_to_speech(
 
     Args:
         request: Text-to-speech parameters
+        background_tasks: Tasks run after the response is sent
         audio_service: Audio service dependency
 
     Returns:
         TextToSpeechResponse: The TTS result with audio URL
     """
     try:
-        logger.info(f"Converting text to speech: {request.text[:50]}...")
-        
         # Check if TTS service is ready
         if not audio_service.is_tts_ready():
             raise HTTPException(
@@ -409,35 +586,46 @@ async def text_to_speech(
                 detail="Text-to-speech service not ready. Please try again later."
             )
         
-        # Generate speech audio
-        audio_bytes = await audio_service.text_to_speech(
-            request.text, 
-            request.language,
-            request.voice_settings
+        # Name the output by content so identical requests reuse one file
+        audio_filename = _tts_filename(
+            request.text, request.language, request.voice_settings
         )
+        audio_path = TTS_AUDIO_DIR / audio_filename
         
-        # Save audio to temporary file and create URL
-        import uuid
-        audio_id = str(uuid.uuid4())
-        audio_filename = f"tts_{audio_id}.wav"
-        
-        # Create uploads directory if it doesn't exist
-        uploads_dir = Path("uploads/audio")
-        uploads_dir.mkdir(parents=True, exist_ok=True)
-        
-        audio_path = uploads_dir / audio_filename
-        with open(audio_path, 'wb') as f:
-            f.write(audio_bytes)
+        if audio_path.exists():
+            background_tasks.add_task(
+                logger.info, "Reusing cached speech audio: %s", audio_filename
+            )
+            audio_size = audio_path.stat().st_size
+        else:
+            # Generate speech audio
+            audio_bytes = await audio_service.text_to_speech(
+                request.text, 
+                request.language,
+                request.voice_settings
+            )
+            
+            # Write the WAV in a worker thread so large files do not block the
+            # event loop; it must exist before the URL is handed to the client
+            await run_in_threadpool(_write_file_atomic, audio_path, audio_bytes)
+            audio_size = len(audio_bytes)
+            background_tasks.add_task(
+                logger.info,
+                "Converted text to speech: %s... -> %s",
+                request.text[:50],
+                audio_filename,
+            )
         
         # Calculate duration (rough estimate)
-        duration = len(audio_bytes) / (16000 * 2)  # Assuming 16kHz, 16-bit
+        duration = audio_size / (16000 * 2)  # Assuming 16kHz, 16-bit
         
-        return TextToSpeechResponse(
-            success=True,
-            audio_url=f"/static/audio/{audio_filename}",
-            duration=duration,
-            language=request.language or "en"
-        )
+        return {
+            "success": True,
+            # Served by the files router from TTS_AUDIO_DIR
+            "audio_url": f"/api/files/audio/{audio_filename}",
+            "duration": duration,
+            "language": request.language or "en",
+        }
 
     except AudioTTSException as e:
         logger.warning(f"TTS error: {str(e)}")
@@ -497,20 +685,26 @@ async def process_document(
                 status_code=400, detail="Only PDF files are supported"
             )
 
-        # Read the file
-        pdf_bytes = await file.read()
-
-        if not pdf_bytes:
+        # Only peek at the start of the upload; reject anything that does
+        # not carry the PDF signature before reading further
+        header = await file.read(len(PDF_MAGIC))
+        if not header:
             raise HTTPException(status_code=400, detail="Empty file")
+        if header != PDF_MAGIC:
+            raise HTTPException(
+                status_code=415, detail="File content is not a PDF document"
+            )
 
         # Mock document processing
-        return DocumentProcessingResponse(
-            title="Mock Document Title",
-            author="Mock Author",
-            num_pages=1,
-            pages=[{"page": 1, "content": "Mock document content"}],
-        )
-
+        return {
+            "title": "Mock Document Title",
+            "author": "Mock Author",
+            "num_pages": 1,
+            "pages": [{"page": 1, "content": "Mock document content"}],
+        }
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Document processing error: {str(e)}")
         raise HTTPException(
@@ -518,11 +712,25 @@ async def process_document(
         )
 
 
-# Cleanup function for background tasks
-def cleanup_resources():
-    """Clean up AI resources when the application shuts down."""
-    global _ai_factory
-    if _ai_factory:
-        logger.info("Cleaning up AI resources")
-        _ai_factory.shutdown()
-        _ai_factory = None
+@router.post(
+    "/process-documents", response_model=List[DocumentProcessingResponse]
+)
+async def process_documents(
+    files: List[UploadFile] = File(...),
+):
+    """
+    Process several PDF documents in one request.
+
+    Args:
+        files: PDF files, at most MAX_BATCH_SIZE
+
+    Returns:
+        List[DocumentProcessingResponse]: The extracted content in upload order
+    """
+    if len(files) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_SIZE} files can be processed at once",
+        )
+
+    return await asyncio.gather(*(process_document(file) for file in files))
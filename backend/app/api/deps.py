@@ -4,7 +4,12 @@ Provides service dependencies for FastAPI endpoints
 """
 
 from app.models.user import User
-from app.core.dependencies import get_ai_service, get_audio_service, get_document_service
+from app.core.dependencies import (
+    get_ai_service,
+    get_audio_service,
+    get_document_service,
+    set_services,
+)
 
 
 def get_current_active_user() -> User:
@@ -7,17 +7,19 @@ import os
 from fastapi import APIRouter, File, HTTPException, UploadFile
 from fastapi.responses import FileResponse
 
-from ..core.config import Settings
+from ..core.config import settings
 from ..core.logging import get_logger
 from ..core.storage import StorageService
 
-settings = Settings()
 logger = get_logger(__name__)
 router = APIRouter(prefix="/api/files", tags=["Files"])
 
 # Initialize storage service
 storage_service = StorageService()
 
+# Storage areas an upload may be filed under
+FILE_TYPES = frozenset({"audio", "documents", "images", "temp"})
+
 
 @router.post("/upload")
 async def upload_file(
@@ -36,7 +38,7 @@ async def upload_file(
     """
     try:
         # Validate file type
-        if file_type not in ["audio", "documents", "images", "temp"]:
+        if file_type not in FILE_TYPES:
             raise HTTPException(status_code=400, detail="Invalid file type")
 
         # Validate file extension
@@ -47,14 +49,14 @@ async def upload_file(
             )
 
         # Save file
-        file_path, filename = await storage_service.save_upload(
+        _, filename, size = await storage_service.save_upload(
             file, file_type=file_type
         )
 
         return {
             "filename": filename,
             "fileType": file_type,
-            "size": os.path.getsize(file_path),
+            "size": size,
             "url": f"/api/files/{file_type}/{filename}",
         }
 
@@ -83,11 +85,19 @@ async def get_file(
     try:
         file_path = storage_service.get_file_path(filename, file_type)
 
-        if not file_path.exists():
+        # Stat once here and hand the result to FileResponse, which would
+        # otherwise stat the file again before sending it
+        try:
+            stat_result = os.stat(file_path)
+        except FileNotFoundError:
             raise HTTPException(status_code=404, detail="File not found")
 
-        return FileResponse(file_path, filename=filename)
+        return FileResponse(
+            file_path, filename=filename, stat_result=stat_result
+        )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"File retrieval error: {str(e)}")
         raise HTTPException(
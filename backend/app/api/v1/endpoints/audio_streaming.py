@@ -3,16 +3,17 @@ Audio Streaming API Endpoints for LLB Backend
 WebSocket-based real-time audio processing for longer conversations
 """
 
-import asyncio
-import json
 import logging
+import time
 from typing import Dict, Optional
 
+import orjson
+
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Depends, HTTPException
 from fastapi.responses import JSONResponse
 
 from app.api import deps
-from app.services.audio_streaming_service import AudioStreamingService
+from app.services.audio_streaming_service import AudioStreamingService, json_dumps
 from app.core.logging import get_logger
 from app.core.sanitizer import sanitize_html, sanitize_log_input
 
@@ -181,12 +182,16 @@ async def websocket_audio_stream(
     - Receives text for TTS generation
     - Sends audio responses back to client
     
-    Message format:
+    Text frames carry JSON messages:
     {
         "type": "audio_chunk" | "text_request" | "control",
         "data": {...},
         "timestamp": float
     }
+
+    Binary frames carry raw audio bytes. An "audio_chunk" message without
+    "audio_data" acts as the header for the next binary frame, supplying
+    its "is_final" and "chunk_index".
     """
     await websocket.accept()
     logger.info(f"WebSocket connected for session: {session_id}")
@@ -196,24 +201,41 @@ async def websocket_audio_stream(
         await service.connect_websocket(session_id, websocket)
         
         # Send initial connection confirmation
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(json_dumps({
             "type": "connection_established",
             "session_id": session_id,
             "message": "WebSocket connected successfully",
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.time()
         }))
         
+        # Header of the next binary audio frame
+        audio_header: Dict = {}
+
         # Main message processing loop
         while True:
             try:
                 # Receive message from client
-                data = await websocket.receive_text()
-                message = json.loads(data)
+                frame = await websocket.receive()
+                if frame["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(frame.get("code", 1000))
+
+                if frame.get("bytes") is not None:
+                    await handle_audio_chunk(
+                        service, session_id, audio_header, websocket,
+                        audio_bytes=frame["bytes"],
+                    )
+                    audio_header = {}
+                    continue
+
+                message = orjson.loads(frame["text"])
                 
                 message_type = message.get("type")
                 message_data = message.get("data", {})
                 
                 if message_type == "audio_chunk":
+                    if "audio_data" not in message_data:
+                        audio_header = message_data
+                        continue
                     await handle_audio_chunk(service, session_id, message_data, websocket)
                 
                 elif message_type == "text_request":
@@ -225,27 +247,30 @@ async def websocket_audio_stream(
                 else:
                     # Sanitize message_type to prevent XSS
                     safe_message_type = sanitize_html(str(message_type))
-                    await websocket.send_text(json.dumps({
+                    await websocket.send_text(json_dumps({
                         "type": "error",
                         "message": f"Unknown message type: {safe_message_type}",
-                        "timestamp": asyncio.get_event_loop().time()
+                        "timestamp": time.time()
                     }))
             
-            except json.JSONDecodeError as e:
+            except WebSocketDisconnect:
+                raise
+
+            except orjson.JSONDecodeError as e:
                 # Sanitize exception message to prevent XSS
                 safe_error = sanitize_html(str(e))
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(json_dumps({
                     "type": "error",
                     "message": f"Invalid JSON format: {safe_error}",
-                    "timestamp": asyncio.get_event_loop().time()
+                    "timestamp": time.time()
                 }))
             
             except Exception as e:
                 logger.error(f"Error processing WebSocket message: {e}")
-                await websocket.send_text(json.dumps({
+                await websocket.send_text(json_dumps({
                     "type": "error",
                     "message": f"Message processing error: {str(e)}",
-                    "timestamp": asyncio.get_event_loop().time()
+                    "timestamp": time.time()
                 }))
     
     except WebSocketDisconnect:
@@ -266,7 +291,8 @@ async def handle_audio_chunk(
     service: AudioStreamingService,
     session_id: str,
     data: Dict,
-    websocket: WebSocket
+    websocket: WebSocket,
+    audio_bytes: Optional[bytes] = None
 ):
     """
     Handle incoming audio chunk for transcription.
@@ -277,14 +303,20 @@ async def handle_audio_chunk(
         "is_final": bool,
         "chunk_index": int
     }
+
+    When the audio arrived in a binary frame it is passed as audio_bytes
+    and data only holds "is_final" and "chunk_index".
     """
     try:
-        # Decode audio data from hex
-        audio_hex = data.get("audio_data", "")
-        if not audio_hex:
+        if audio_bytes is None:
+            # Legacy clients send the audio as a hex string
+            audio_hex = data.get("audio_data", "")
+            if not audio_hex:
+                raise ValueError("No audio data provided")
+            audio_bytes = bytes.fromhex(audio_hex)
+        elif not audio_bytes:
             raise ValueError("No audio data provided")
         
-        audio_bytes = bytes.fromhex(audio_hex)
         is_final = data.get("is_final", False)
         chunk_index = data.get("chunk_index", 0)
         
@@ -294,13 +326,13 @@ async def handle_audio_chunk(
         )
         
         # Send acknowledgment
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(json_dumps({
             "type": "chunk_received",
             "chunk_id": chunk_id,
             "chunk_index": chunk_index,
             "size": len(audio_bytes),
             "is_final": is_final,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.time()
         }))
         
     except Exception as e:
@@ -308,10 +340,10 @@ async def handle_audio_chunk(
         # Sanitize exception message to prevent XSS
         import html
         safe_error = html.escape(str(e))
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(json_dumps({
             "type": "error",
             "message": f"Audio chunk processing error: {safe_error}",
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.time()
         }))
 
 
@@ -342,19 +374,19 @@ async def handle_text_request(
         await service.generate_speech_response(session_id, text, language)
         
         # Send acknowledgment
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(json_dumps({
             "type": "tts_queued",
             "text": text[:50] + "..." if len(text) > 50 else text,
             "language": language,
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.time()
         }))
         
     except Exception as e:
         logger.error(f"Error handling text request: {e}")
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(json_dumps({
             "type": "error",
             "message": f"Text request processing error: {str(e)}",
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.time()
         }))
 
 
@@ -377,41 +409,41 @@ async def handle_control_message(
         command = data.get("command", "")
         
         if command == "ping":
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(json_dumps({
                 "type": "pong",
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": time.time()
             }))
         
         elif command == "stats":
             stats = await service.get_session_stats(session_id)
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(json_dumps({
                 "type": "stats_response",
                 "stats": stats,
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": time.time()
             }))
         
         elif command == "reset":
             # Reset session buffers (keep session active)
             # This could be implemented to clear conversation history
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(json_dumps({
                 "type": "reset_complete",
                 "message": "Session buffers reset",
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": time.time()
             }))
         
         else:
-            await websocket.send_text(json.dumps({
+            await websocket.send_text(json_dumps({
                 "type": "error",
                 "message": f"Unknown control command: {command}",
-                "timestamp": asyncio.get_event_loop().time()
+                "timestamp": time.time()
             }))
     
     except Exception as e:
         logger.error(f"Error handling control message: {e}")
-        await websocket.send_text(json.dumps({
+        await websocket.send_text(json_dumps({
             "type": "error",
             "message": f"Control message processing error: {str(e)}",
-            "timestamp": asyncio.get_event_loop().time()
+            "timestamp": time.time()
         }))
 
 
@@ -174,6 +174,7 @@ async def chat_with_ai(
                 **(message.context or {}),
                 "citations": [_citation_dict(source) for source in citations],
             },
+            cache=True,
         )
 
         response["language"] = response_language
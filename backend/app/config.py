@@ -19,6 +19,7 @@ class Settings(BaseSettings):
     ollama_model: str = "llama3.2"
     
     whisper_model_path: str = "./models/whisper"
+    max_file_size: int = 50 * 1024 * 1024  # 50MB
     
     database_url: str = "sqlite:///./llb.db"
     
@@ -1,13 +1,10 @@
 """
 AI core module stub
 """
+from app.core.dependencies import get_ai_service
 from app.services.ai_service import AIService
 
-_ai_service = None
 
-def get_ai_model():
-    """Get AI model instance"""
-    global _ai_service
-    if _ai_service is None:
-        _ai_service = AIService()
-    return _ai_service
\ No newline at end of file
+def get_ai_model() -> AIService:
+    """Get AI model instance shared with the rest of the app"""
+    return get_ai_service()
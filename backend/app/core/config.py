@@ -5,6 +5,9 @@ from typing import List
 from pydantic import AnyHttpUrl, field_validator
 from pydantic_settings import BaseSettings
 
+# Uploads are copied to disk in chunks of this size rather than read whole
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "LLB API"
@@ -56,7 +59,7 @@ class Settings(BaseSettings):
     BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
     UPLOAD_DIR: Path = BASE_DIR / "uploads"
     MAX_UPLOAD_SIZE: int = 50 * 1024 * 1024  # 50MB
-    ALLOWED_EXTENSIONS: set[str] = {
+    ALLOWED_EXTENSIONS: frozenset[str] = frozenset({
         # Audio
         ".mp3",
         ".wav",
@@ -72,7 +75,13 @@ class Settings(BaseSettings):
         ".jpeg",
         ".png",
         ".gif",
-    }
+    })
+
+    @field_validator("ALLOWED_EXTENSIONS", mode="after")
+    @classmethod
+    def normalize_extensions(cls, v):
+        # Lower-case once here so uploads only need a set lookup
+        return frozenset(ext.lower() for ext in v)
 
     model_config = {"case_sensitive": True, "env_file": ".env"}
 
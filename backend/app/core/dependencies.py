@@ -1,6 +1,7 @@
 """
 Centralized dependency injection to avoid circular imports
 """
+from functools import lru_cache
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -14,15 +15,30 @@ _audio_service: Optional["AudioService"] = None
 _document_service: Optional["DocumentService"] = None
 
 
+def set_services(
+    ai_service: "AIService",
+    audio_service: "AudioService",
+    document_service: "DocumentService",
+):
+    set_ai_service(ai_service)
+    set_audio_service(audio_service)
+    set_document_service(document_service)
+
+
 def set_ai_service(service: "AIService"):
     global _ai_service
     _ai_service = service
 
 
+@lru_cache(maxsize=1)
+def _default_ai_service() -> "AIService":
+    from app.services.ai_service import AIService
+    return AIService()
+
+
 def get_ai_service() -> "AIService":
     if _ai_service is None:
-        from app.services.ai_service import AIService
-        return AIService()
+        return _default_ai_service()
     return _ai_service
 
 
@@ -31,10 +47,15 @@ def set_audio_service(service: "AudioService"):
     _audio_service = service
 
 
+@lru_cache(maxsize=1)
+def _default_audio_service() -> "AudioService":
+    from app.services.audio_service import AudioService
+    return AudioService()
+
+
 def get_audio_service() -> "AudioService":
     if _audio_service is None:
-        from app.services.audio_service import AudioService
-        return AudioService()
+        return _default_audio_service()
     return _audio_service
 
 
@@ -43,8 +64,13 @@ def set_document_service(service: "DocumentService"):
     _document_service = service
 
 
+@lru_cache(maxsize=1)
+def _default_document_service() -> "DocumentService":
+    from app.services.document_service import DocumentService
+    return DocumentService()
+
+
 def get_document_service() -> "DocumentService":
     if _document_service is None:
-        from app.services.document_service import DocumentService
-        return DocumentService()
-    return _document_service
\ No newline at end of file
+        return _default_document_service()
+    return _document_service
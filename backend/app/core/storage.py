@@ -2,20 +2,18 @@
 Storage service for handling file uploads and processing.
 """
 
-import shutil
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple
 
+import aiofiles
 from fastapi import UploadFile
 import logging
-from .config import Settings
+from .config import UPLOAD_CHUNK_SIZE, settings
 from .sanitizer import sanitize_path, sanitize_log_input
 
 logger = logging.getLogger(__name__)
 
-settings = Settings()
-
 
 class StorageService:
     """Service for handling file storage and processing."""
@@ -41,7 +39,7 @@ class StorageService:
         file: UploadFile,
         file_type: str = "temp",
         custom_filename: Optional[str] = None,
-    ) -> Tuple[Path, str]:
+    ) -> Tuple[Path, str, int]:
         """
         Save an uploaded file.
 
@@ -51,7 +49,7 @@ class StorageService:
             custom_filename: Optional custom filename
 
         Returns:
-            Tuple of (file path, filename)
+            Tuple of (file path, filename, size in bytes)
         """
         try:
             # Generate filename
@@ -73,13 +71,17 @@ class StorageService:
             # Ensure directory exists
             save_dir.mkdir(parents=True, exist_ok=True)
 
-            # Save file
+            # Stream the file to disk without blocking the event loop,
+            # counting bytes so callers need not stat it again
             file_path = save_dir / filename
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            size = 0
+            async with aiofiles.open(file_path, "wb") as buffer:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    await buffer.write(chunk)
+                    size += len(chunk)
 
             logger.info(f"File saved: {file_path}")
-            return file_path, filename
+            return file_path, filename, size
 
         except Exception as e:
             logger.error(f"Error saving file: {str(e)}")
@@ -224,6 +224,9 @@ def create_desktop_app() -> FastAPI:
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
                 detail=str(exc),
             ) from exc
+        finally:
+            # Each request builds its own manager; release its HTTP pools
+            await manager.close()
 
         return DesktopChatResponse(
             response=provider_response,
@@ -247,13 +250,16 @@ def create_desktop_app() -> FastAPI:
     @desktop_app.get("/api/v1/chat/status")
     async def get_chat_status() -> Dict[str, object]:
         manager = ai_providers.AIProviderManager()
-        return {
-            "status": "ready" if manager.providers else "needs_provider",
-            "model_info": manager.get_provider_info(),
-            "configured_providers": manager.get_configured_provider_status(),
-            "supported_languages": ["en", "zh-CN"],
-            "local_ml": False,
-        }
+        try:
+            return {
+                "status": "ready" if manager.providers else "needs_provider",
+                "model_info": manager.get_provider_info(),
+                "configured_providers": manager.get_configured_provider_status(),
+                "supported_languages": ["en", "zh-CN"],
+                "local_ml": False,
+            }
+        finally:
+            await manager.close()
 
     desktop_app.include_router(
         desktop.router,
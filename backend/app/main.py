@@ -13,7 +13,8 @@ from contextlib import asynccontextmanager
 
 from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.api import deps
@@ -114,6 +115,7 @@ def create_app() -> FastAPI:
         version=settings.VERSION,
         debug=settings.LOG_LEVEL == "DEBUG",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Configure CORS
@@ -125,6 +127,9 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress larger JSON bodies such as transcripts and document pages
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
     # Serve static files
     static_path = Path(settings.UPLOAD_DIR).parent / "static"
     static_path.mkdir(exist_ok=True)
@@ -3,41 +3,77 @@ AI Service for LLB Backend
 Handles AI model interactions and text generation using comprehensive prompt system
 """
 
-import re
 import sys
 import os
 from typing import Any, Dict, List, Optional
 
 from app.core.logging import get_logger
+from services.language import CJK_PATTERN
 
 # Lazy imports to avoid circular dependencies
 ModelService = None
-PromptEngine = None
+get_prompt_engine = None
+
+_AI_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'ai'))
 
 def _get_model_service():
     global ModelService
     if ModelService is None:
         try:
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'services'))
-            from model_service import ModelService as MS
+            from services.model_service import ModelService as MS
             ModelService = MS
         except ImportError:
             pass
     return ModelService
 
 def _get_prompt_engine():
-    global PromptEngine
-    if PromptEngine is None:
+    global get_prompt_engine
+    if get_prompt_engine is None:
         try:
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'ai'))
-            from prompts import PromptEngine as PE
-            PromptEngine = PE
+            if _AI_DIR not in sys.path:
+                sys.path.append(_AI_DIR)
+            from prompts import get_prompt_engine as GPE
+            get_prompt_engine = GPE
         except ImportError:
             pass
-    return PromptEngine
+    return get_prompt_engine
 
 logger = get_logger(__name__)
 
+HENAN_DIALECT_MARKERS = ("俺", "咋", "啥", "中不中", "对象")
+
+# Topic classification keywords, checked in order by AIService._classify_topic
+TOPIC_KEYWORDS = {
+    "anatomy": {
+        "en": ("anatomy", "body", "organ", "menstruation", "period", "puberty", "development"),
+        "zh-CN": ("解剖", "身体", "器官", "月经", "生理期", "青春期", "发育"),
+    },
+    "contraception": {
+        "en": ("contraception", "birth control", "condom", "pill", "emergency", "pregnancy"),
+        "zh-CN": ("避孕", "避孕套", "安全套", "避孕药", "紧急", "怀孕"),
+    },
+    "sti_prevention": {
+        "en": ("sti", "std", "infection", "disease", "hiv", "aids", "prevention"),
+        "zh-CN": ("性病", "感染", "疾病", "艾滋", "预防", "传播"),
+    },
+    "consent_education": {
+        "en": ("consent", "permission", "agreement", "boundaries", "respect"),
+        "zh-CN": ("同意", "许可", "界限", "尊重", "边界"),
+    },
+    "relationship": {
+        "en": ("relationship", "partner", "communication", "discuss", "talk"),
+        "zh-CN": ("关系", "伴侣", "沟通", "讨论", "交流"),
+    },
+    "safety_education": {
+        "en": ("safety", "safe", "protection", "assault", "abuse"),
+        "zh-CN": ("安全", "保护", "侵犯", "虐待"),
+    },
+}
+
+SUPPORTED_LANGUAGES = ("en", "zh-CN")
+# basic_education is the fallback when no keyword matches
+AVAILABLE_TOPICS = ("basic_education", *TOPIC_KEYWORDS)
+
 
 class AIService:
     """Service for AI model operations with comprehensive prompt system."""
@@ -57,9 +93,9 @@ class AIService:
                 self.model_service = MS()
         
         if self.prompt_engine is None:
-            PE = _get_prompt_engine()
-            if PE:
-                self.prompt_engine = PE()
+            GPE = _get_prompt_engine()
+            if GPE:
+                self.prompt_engine = GPE()
 
     async def initialize(self):
         """Initialize AI model and prompt system."""
@@ -84,12 +120,11 @@ class AIService:
 
     def _detect_language(self, text: str) -> str:
         """Detect language from text."""
-        # Simple language detection based on character patterns
-        chinese_chars = re.findall(r"[\u4e00-\u9fff]", text)
-        if chinese_chars:
+        # Simple language detection based on character patterns; stop at
+        # the first CJK character instead of collecting all of them.
+        if CJK_PATTERN.search(text):
             # Check for Henan dialect markers
-            henan_markers = ["俺", "咋", "啥", "中不中", "对象"]
-            if any(marker in text for marker in henan_markers):
+            if any(marker in text for marker in HENAN_DIALECT_MARKERS):
                 return "zh-CN-henan"
             return "zh-CN"
         return "en"
@@ -98,39 +133,11 @@ class AIService:
         """Classify the topic of the user's message for appropriate prompt selection."""
         message_lower = message.lower()
         
-        # Topic classification keywords
-        topic_keywords = {
-            "anatomy": {
-                "en": ["anatomy", "body", "organ", "menstruation", "period", "puberty", "development"],
-                "zh-CN": ["解剖", "身体", "器官", "月经", "生理期", "青春期", "发育"]
-            },
-            "contraception": {
-                "en": ["contraception", "birth control", "condom", "pill", "emergency", "pregnancy"],
-                "zh-CN": ["避孕", "避孕套", "安全套", "避孕药", "紧急", "怀孕"]
-            },
-            "sti_prevention": {
-                "en": ["sti", "std", "infection", "disease", "hiv", "aids", "prevention"],
-                "zh-CN": ["性病", "感染", "疾病", "艾滋", "预防", "传播"]
-            },
-            "consent_education": {
-                "en": ["consent", "permission", "agreement", "boundaries", "respect"],
-                "zh-CN": ["同意", "许可", "界限", "尊重", "边界"]
-            },
-            "relationship": {
-                "en": ["relationship", "partner", "communication", "discuss", "talk"],
-                "zh-CN": ["关系", "伴侣", "沟通", "讨论", "交流"]
-            },
-            "safety_education": {
-                "en": ["safety", "safe", "protection", "assault", "abuse"],
-                "zh-CN": ["安全", "保护", "侵犯", "虐待"]
-            }
-        }
-        
         # Check for topic matches
         lang_key = "zh-CN" if language.startswith("zh-CN") else "en"
         
-        for topic, keywords in topic_keywords.items():
-            if any(keyword in message_lower for keyword in keywords.get(lang_key, [])):
+        for topic, keywords in TOPIC_KEYWORDS.items():
+            if any(keyword in message_lower for keyword in keywords.get(lang_key, ())):
                 return topic
         
         # Default to basic education
@@ -141,8 +148,13 @@ class AIService:
         message: str,
         language: str = "en",
         context: Optional[Dict[str, Any]] = None,
+        cache: bool = False,
     ) -> Dict[str, Any]:
-        """Generate AI response to user message using comprehensive prompt system."""
+        """Generate AI response to user message using comprehensive prompt system.
+
+        With cache=True, the model service may reuse earlier answers to the
+        same prompt; only interactive chat opts in.
+        """
         if not self.is_initialized:
             raise RuntimeError("AI service not initialized")
 
@@ -171,7 +183,7 @@ class AIService:
             
             # Generate response using the model service
             ai_response = await self.model_service.generate_response_with_language(
-                optimized_prompt, response_language
+                optimized_prompt, response_language, cache=cache
             )
             
             response = {
@@ -242,7 +254,7 @@ class AIService:
 
     def get_supported_languages(self) -> List[str]:
         """Get list of supported languages."""
-        return ["en", "zh-CN"]
+        return list(SUPPORTED_LANGUAGES)
 
     def get_model_info(self) -> Dict[str, Any]:
         """Get AI model information."""
@@ -271,12 +283,4 @@ class AIService:
 
     def get_available_topics(self) -> List[str]:
         """Get list of available sexual health topics."""
-        return [
-            "basic_education",
-            "anatomy",
-            "contraception",
-            "sti_prevention",
-            "consent_education",
-            "relationship",
-            "safety_education"
-        ]
+        return list(AVAILABLE_TOPICS)
@@ -6,12 +6,15 @@ Handles audio processing and speech-to-text using Whisper
 import os
 import tempfile
 import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 import io
 
 import torch
 import whisper
+import aiofiles
 import numpy as np
 from fastapi import UploadFile
 
@@ -25,6 +28,7 @@ except ImportError:
 
 from app.core.logging import get_logger
 from app.config import settings
+from app.core.config import UPLOAD_CHUNK_SIZE
 from app.core.exceptions import (
     AudioProcessingException,
     AudioFormatException,
@@ -35,6 +39,9 @@ from app.core.exceptions import (
 
 logger = get_logger(__name__)
 
+# Transcriptions of recently seen uploads, keyed by audio content hash
+TRANSCRIPTION_CACHE_SIZE = 256
+
 
 class AudioService:
     """Service for audio processing operations using Whisper."""
@@ -47,6 +54,7 @@ class AudioService:
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.is_initialized = False
         self.tts_initialized = False
+        self._transcription_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.supported_languages = [
             "zh",  # Chinese
             "en",  # English
@@ -60,7 +68,7 @@ class AudioService:
             logger.info(f"Initializing Whisper model ({self.model_size}) on {self.device}...")
             
             # Load Whisper model in a thread to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             self.whisper_model = await loop.run_in_executor(
                 None, self._load_whisper_model
             )
@@ -139,6 +147,7 @@ class AudioService:
             # Clear model from memory
             del self.whisper_model
             self.whisper_model = None
+            self._transcription_cache.clear()
             
             # Clear CUDA cache if using GPU
             if torch.cuda.is_available():
@@ -194,15 +203,7 @@ class AudioService:
                 temp_path = temp_file.name
 
             try:
-                # Perform transcription in executor to avoid blocking
-                loop = asyncio.get_event_loop()
-                result = await loop.run_in_executor(
-                    None, self._transcribe_file, temp_path, language, task
-                )
-                
-                logger.info("✅ Audio transcription completed successfully")
-                return result
-                
+                return await self._transcribe_in_executor(temp_path, language, task)
             finally:
                 # Clean up temporary file
                 if os.path.exists(temp_path):
@@ -218,6 +219,20 @@ class AudioService:
                 {"language": language, "task": task, "data_size": len(audio_data)}
             )
 
+    async def _transcribe_in_executor(
+        self,
+        file_path: str,
+        language: Optional[str] = None,
+        task: str = "transcribe"
+    ) -> Dict[str, Any]:
+        """Run the blocking Whisper transcription off the event loop."""
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(
+            None, self._transcribe_file, file_path, language, task
+        )
+        logger.info("✅ Audio transcription completed successfully")
+        return result
+
     def _transcribe_file(
         self, 
         file_path: str, 
@@ -335,33 +350,67 @@ class AudioService:
                     {"filename": file.filename}
                 )
                 
-            # Check file size
-            content = await file.read()
-            if len(content) == 0:
-                raise AudioFormatException(
-                    "Empty file uploaded",
-                    {"filename": file.filename, "size": len(content)}
-                )
-                
-            if len(content) > settings.max_file_size:
-                raise AudioFormatException(
-                    f"File too large: {len(content)} bytes (max: {settings.max_file_size})",
-                    {"filename": file.filename, "size": len(content), "max_size": settings.max_file_size}
-                )
-            
-            # Validate file type
+            # Validate file type before reading anything
             if not self._is_valid_audio_file(file.filename):
                 raise AudioFormatException(
                     f"Unsupported file type: {file.filename}",
                     {"filename": file.filename, "supported_formats": self.get_supported_formats()}
                 )
-            
-            logger.info(f"Transcribing uploaded file: {file.filename}")
-            
-            # Transcribe audio
-            result = await self.transcribe_audio(content, language)
+
+            if not self.is_initialized or self.whisper_model is None:
+                raise AudioServiceUnavailableException(
+                    "Audio service not initialized",
+                    {"is_initialized": self.is_initialized, "model_loaded": self.whisper_model is not None}
+                )
+
+            # Stream the upload to disk in chunks with aiofiles, as
+            # StorageService.save_upload does, so memory stays flat and the
+            # event loop is never blocked on a write. Stop as soon as the
+            # limit is hit; the content is hashed on the way so repeat
+            # uploads are reused.
+            temp_path = None
+            hasher = hashlib.sha256()
+            try:
+                async with aiofiles.tempfile.NamedTemporaryFile(
+                    suffix='.wav', delete=False
+                ) as temp_file:
+                    temp_path = temp_file.name
+                    size = 0
+                    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                        size += len(chunk)
+                        hasher.update(chunk)
+                        if size > settings.max_file_size:
+                            raise AudioFormatException(
+                                f"File too large: more than {settings.max_file_size} bytes",
+                                {"filename": file.filename, "max_size": settings.max_file_size}
+                            )
+                        await temp_file.write(chunk)
+
+                if size == 0:
+                    raise AudioFormatException(
+                        "Empty file uploaded",
+                        {"filename": file.filename, "size": size}
+                    )
+
+                cache_key = f"{self.model_size}:{language}:{hasher.hexdigest()}"
+                cached = self._transcription_cache.get(cache_key)
+                if cached is not None:
+                    logger.info(f"Reusing transcription for uploaded file: {file.filename}")
+                    self._transcription_cache.move_to_end(cache_key)
+                    result = dict(cached)
+                else:
+                    logger.info(f"Transcribing uploaded file: {file.filename}")
+
+                    # Transcribe audio
+                    result = await self._transcribe_in_executor(temp_path, language)
+                    self._transcription_cache[cache_key] = dict(result)
+                    if len(self._transcription_cache) > TRANSCRIPTION_CACHE_SIZE:
+                        self._transcription_cache.popitem(last=False)
+            finally:
+                if temp_path and os.path.exists(temp_path):
+                    os.unlink(temp_path)
+
             result["filename"] = file.filename
-            
             return result
             
         except (AudioFormatException, AudioTranscriptionException, AudioServiceUnavailableException):
@@ -477,7 +526,7 @@ class AudioService:
                 await self._set_voice_for_language(language)
 
             # Generate speech in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             audio_bytes = await loop.run_in_executor(
                 None, self._generate_speech, text
             )
@@ -11,8 +11,8 @@ import time
 import uuid
 from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 from pathlib import Path
-import json
 
+import orjson
 import torch
 import whisper
 import numpy as np
@@ -41,6 +41,11 @@ from app.core.exceptions import (
 logger = get_logger(__name__)
 
 
+def json_dumps(message: Dict) -> str:
+    """Serialize a WebSocket message with orjson."""
+    return orjson.dumps(message, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
 class AudioChunk:
     """Represents a chunk of audio data for streaming processing."""
     
@@ -190,7 +195,7 @@ class AudioStreamingService:
             logger.info(f"Initializing Audio Streaming Service on {self.device}...")
             
             # Load Whisper model
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             self.whisper_model = await loop.run_in_executor(
                 None, self._load_whisper_model
             )
@@ -466,7 +471,7 @@ class AudioStreamingService:
             
             try:
                 # Transcribe the chunk
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 result = await loop.run_in_executor(
                     None, self._transcribe_chunk_file, temp_path, session.language
                 )
@@ -539,7 +544,7 @@ class AudioStreamingService:
             if not self.tts_initialized or not self.tts_engine:
                 return None
             
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             audio_data = await loop.run_in_executor(
                 None, self._generate_speech_blocking, text, language
             )
@@ -613,7 +618,7 @@ class AudioStreamingService:
                     "session_id": session.session_id,
                     "timestamp": time.time()
                 }
-                await session.websocket.send_text(json.dumps(message))
+                await session.websocket.send_text(json_dumps(message))
         
         except Exception as e:
             logger.error(f"Error sending transcription result: {e}")
@@ -634,7 +639,7 @@ class AudioStreamingService:
                     "session_id": session.session_id,
                     "timestamp": time.time()
                 }
-                await session.websocket.send_text(json.dumps(message))
+                await session.websocket.send_text(json_dumps(message))
         
         except Exception as e:
             logger.error(f"Error sending audio chunk: {e}")
@@ -157,6 +157,23 @@ class AIProvider(ABC):
     name: str = "unknown"
     model: str = ""
     credential_source: str = "environment"
+    _client: Optional[httpx.AsyncClient] = None
+
+    def _http(self) -> httpx.AsyncClient:
+        """Return this provider's pooled HTTP client, creating it on first use.
+
+        Reusing one client keeps connections alive across requests, so
+        concurrent generations do not each pay a fresh TCP/TLS handshake.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient()
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was opened."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     @abstractmethod
     async def generate_response(self, prompt: str, **kwargs) -> str:
@@ -179,27 +196,27 @@ class OpenAIProvider(AIProvider):
         self.credential_source = credential_source
     
     async def generate_response(self, prompt: str, **kwargs) -> str:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://api.openai.com/v1/chat/completions",
-                headers={"Authorization": f"Bearer {self.api_key}"},
-                json={
-                    "model": self.model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": kwargs.get("max_tokens", 150)
-                }
-            )
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"]
+        client = self._http()
+        response = await client.post(
+            "https://api.openai.com/v1/chat/completions",
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={
+                "model": self.model,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": kwargs.get("max_tokens", 150)
+            }
+        )
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
     
     async def is_available(self) -> bool:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://api.openai.com/v1/models",
-                    headers={"Authorization": f"Bearer {self.api_key}"}
-                )
-                return response.status_code == 200
+            client = self._http()
+            response = await client.get(
+                "https://api.openai.com/v1/models",
+                headers={"Authorization": f"Bearer {self.api_key}"}
+            )
+            return response.status_code == 200
         except:
             return False
 
@@ -216,7 +233,25 @@ class ClaudeProvider(AIProvider):
         self.credential_source = credential_source
     
     async def generate_response(self, prompt: str, **kwargs) -> str:
-        async with httpx.AsyncClient() as client:
+        client = self._http()
+        response = await client.post(
+            "https://api.anthropic.com/v1/messages",
+            headers={
+                "x-api-key": self.api_key,
+                "anthropic-version": "2023-06-01"
+            },
+            json={
+                "model": self.model,
+                "max_tokens": kwargs.get("max_tokens", 150),
+                "messages": [{"role": "user", "content": prompt}]
+            }
+        )
+        response.raise_for_status()
+        return response.json()["content"][0]["text"]
+    
+    async def is_available(self) -> bool:
+        try:
+            client = self._http()
             response = await client.post(
                 "https://api.anthropic.com/v1/messages",
                 headers={
@@ -225,29 +260,11 @@ class ClaudeProvider(AIProvider):
                 },
                 json={
                     "model": self.model,
-                    "max_tokens": kwargs.get("max_tokens", 150),
-                    "messages": [{"role": "user", "content": prompt}]
+                    "max_tokens": 10,
+                    "messages": [{"role": "user", "content": "test"}]
                 }
             )
-            response.raise_for_status()
-            return response.json()["content"][0]["text"]
-    
-    async def is_available(self) -> bool:
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    "https://api.anthropic.com/v1/messages",
-                    headers={
-                        "x-api-key": self.api_key,
-                        "anthropic-version": "2023-06-01"
-                    },
-                    json={
-                        "model": self.model,
-                        "max_tokens": 10,
-                        "messages": [{"role": "user", "content": "test"}]
-                    }
-                )
-                return response.status_code == 200
+            return response.status_code == 200
         except:
             return False
 
@@ -264,28 +281,28 @@ class GeminiProvider(AIProvider):
         self.credential_source = credential_source
     
     async def generate_response(self, prompt: str, **kwargs) -> str:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent",
-                params={"key": self.api_key},
-                json={
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {
-                        "maxOutputTokens": kwargs.get("max_tokens", 150)
-                    }
+        client = self._http()
+        response = await client.post(
+            f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent",
+            params={"key": self.api_key},
+            json={
+                "contents": [{"parts": [{"text": prompt}]}],
+                "generationConfig": {
+                    "maxOutputTokens": kwargs.get("max_tokens", 150)
                 }
-            )
-            response.raise_for_status()
-            return response.json()["candidates"][0]["content"]["parts"][0]["text"]
+            }
+        )
+        response.raise_for_status()
+        return response.json()["candidates"][0]["content"]["parts"][0]["text"]
     
     async def is_available(self) -> bool:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://generativelanguage.googleapis.com/v1beta/models",
-                    params={"key": self.api_key}
-                )
-                return response.status_code == 200
+            client = self._http()
+            response = await client.get(
+                "https://generativelanguage.googleapis.com/v1beta/models",
+                params={"key": self.api_key}
+            )
+            return response.status_code == 200
         except:
             return False
 
@@ -302,23 +319,23 @@ class OllamaProvider(AIProvider):
         self.credential_source = credential_source
     
     async def generate_response(self, prompt: str, **kwargs) -> str:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False
-                }
-            )
-            response.raise_for_status()
-            return response.json()["response"]
+        client = self._http()
+        response = await client.post(
+            f"{self.base_url}/api/generate",
+            json={
+                "model": self.model,
+                "prompt": prompt,
+                "stream": False
+            }
+        )
+        response.raise_for_status()
+        return response.json()["response"]
     
     async def is_available(self) -> bool:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                return response.status_code == 200
+            client = self._http()
+            response = await client.get(f"{self.base_url}/api/tags")
+            return response.status_code == 200
         except:
             return False
 
@@ -347,29 +364,29 @@ class GitHubModelsProvider(AIProvider):
         }
 
     async def generate_response(self, prompt: str, **kwargs) -> str:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.inference_url,
-                headers=self._headers(),
-                json={
-                    "model": self.model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": kwargs.get("max_tokens", 150),
-                    "temperature": kwargs.get("temperature", 0.7),
-                    "stream": False,
-                },
-            )
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"]
+        client = self._http()
+        response = await client.post(
+            self.inference_url,
+            headers=self._headers(),
+            json={
+                "model": self.model,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": kwargs.get("max_tokens", 150),
+                "temperature": kwargs.get("temperature", 0.7),
+                "stream": False,
+            },
+        )
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
 
     async def is_available(self) -> bool:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.catalog_url,
-                    headers=self._headers(),
-                )
-                return response.status_code == 200
+            client = self._http()
+            response = await client.get(
+                self.catalog_url,
+                headers=self._headers(),
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -388,31 +405,31 @@ class MistralProvider(AIProvider):
         self.models_url = "https://api.mistral.ai/v1/models"
 
     async def generate_response(self, prompt: str, **kwargs) -> str:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.chat_url,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.model,
-                    "messages": [{"role": "user", "content": prompt}],
-                    "max_tokens": kwargs.get("max_tokens", 150),
-                    "temperature": kwargs.get("temperature", 0.7),
-                },
-            )
-            response.raise_for_status()
-            return response.json()["choices"][0]["message"]["content"]
+        client = self._http()
+        response = await client.post(
+            self.chat_url,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            json={
+                "model": self.model,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": kwargs.get("max_tokens", 150),
+                "temperature": kwargs.get("temperature", 0.7),
+            },
+        )
+        response.raise_for_status()
+        return response.json()["choices"][0]["message"]["content"]
 
     async def is_available(self) -> bool:
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    self.models_url,
-                    headers={"Authorization": f"Bearer {self.api_key}"},
-                )
-                return response.status_code == 200
+            client = self._http()
+            response = await client.get(
+                self.models_url,
+                headers={"Authorization": f"Bearer {self.api_key}"},
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -564,6 +581,11 @@ class AIProviderManager:
             
             raise RuntimeError("All AI providers failed")
 
+    async def close(self) -> None:
+        """Release pooled HTTP connections held by every provider."""
+        for provider in self.providers:
+            await provider.aclose()
+
     def get_provider_info(self) -> Dict[str, object]:
         available_providers = []
         for provider in self.providers:
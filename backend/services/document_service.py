@@ -10,8 +10,14 @@ from typing import Optional, Dict, Any
 from fastapi import UploadFile
 import logging
 
+from .language import CJK_PATTERN
+
 logger = logging.getLogger(__name__)
 
+_ENGLISH_MARKERS = ('the', 'and', 'or', 'but', 'in', 'on', 'at')
+_HEALTH_TERMS_EN = ('health', 'sexual', 'contraception', 'education', 'safety')
+_HEALTH_TERMS_ZH = ('健康', '性', '避孕', '教育', '安全')
+
 try:
     import PyPDF2
     import pdfplumber
@@ -150,23 +156,21 @@ class DocumentService:
     def _detect_language_hints(self, text: str) -> list:
         """Detect language hints from text sample."""
         hints = []
+        text_lower = text.lower()
         
         # Check for Chinese characters
-        if any('\u4e00' <= char <= '\u9fff' for char in text):
+        if CJK_PATTERN.search(text):
             hints.append("chinese")
         
         # Check for English patterns
-        if any(word in text.lower() for word in ['the', 'and', 'or', 'but', 'in', 'on', 'at']):
+        if any(word in text_lower for word in _ENGLISH_MARKERS):
             hints.append("english")
         
         # Check for common sexual health terms
-        health_terms_en = ['health', 'sexual', 'contraception', 'education', 'safety']
-        health_terms_zh = ['健康', '性', '避孕', '教育', '安全']
-        
-        if any(term in text.lower() for term in health_terms_en):
+        if any(term in text_lower for term in _HEALTH_TERMS_EN):
             hints.append("sexual_health_en")
         
-        if any(term in text for term in health_terms_zh):
+        if any(term in text for term in _HEALTH_TERMS_ZH):
             hints.append("sexual_health_zh")
         
         return hints
@@ -0,0 +1,8 @@
+"""
+Script patterns shared by the language detection helpers.
+"""
+
+import re
+
+# CJK unified ideographs; any match marks text as Chinese
+CJK_PATTERN = re.compile(r"[\u4e00-\u9fff]")
@@ -1,14 +1,22 @@
+import asyncio
+import hashlib
+import json
 import logging
 import sys
 import os
-from typing import TYPE_CHECKING
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
 if TYPE_CHECKING:
     from .ai_providers import AIProviderManager
 
 # Lazy imports to avoid circular dependencies
 AIProviderManager = None
-PromptEngine = None
+get_prompt_engine = None
+
+_AI_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), '..', '..', 'ai'))
 
 def _get_ai_provider_manager():
     global AIProviderManager
@@ -21,23 +29,50 @@ def _get_ai_provider_manager():
     return AIProviderManager
 
 def _get_prompt_engine():
-    global PromptEngine
-    if PromptEngine is None:
+    global get_prompt_engine
+    if get_prompt_engine is None:
         try:
-            sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'ai'))
-            from prompts import PromptEngine as PE
-            PromptEngine = PE
+            if _AI_DIR not in sys.path:
+                sys.path.append(_AI_DIR)
+            from prompts import get_prompt_engine as GPE
+            get_prompt_engine = GPE
         except ImportError:
             pass
-    return PromptEngine
+    return get_prompt_engine
 
 logger = logging.getLogger(__name__)
 
+# Sampling settings used for every provider call
+MAX_TOKENS = 200
+TEMPERATURE = 0.7
+
+# Chat responses are cached per provider, prompt and sampling settings
+RESPONSE_CACHE_SIZE = 1024
+RESPONSE_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+# Distinct samples kept per prompt when temperature > 0; once the pool is
+# full, cached samples are served in rotation
+RESPONSE_SAMPLE_POOL = 3
+# Above this temperature answers are too varied to reuse
+MAX_CACHEABLE_TEMPERATURE = 1.0
+
+
+@dataclass
+class _CachedResponses:
+    """Sampled responses for one prompt."""
+
+    created: float
+    samples: List[str] = field(default_factory=list)
+    next_index: int = 0
+
+
 class ModelService:
     def __init__(self):
         self.provider_manager = None
         self.prompt_engine = None
         self._loaded = False
+        # Generations currently running, keyed by (prompt, language, cache)
+        self._inflight: Dict[Tuple[str, str, bool], "asyncio.Future[str]"] = {}
+        self._response_cache: "OrderedDict[str, _CachedResponses]" = OrderedDict()
     
     def _ensure_services(self):
         """Lazy load services when needed."""
@@ -47,9 +82,9 @@ class ModelService:
                 self.provider_manager = APM()
         
         if self.prompt_engine is None:
-            PE = _get_prompt_engine()
-            if PE:
-                self.prompt_engine = PE()
+            GPE = _get_prompt_engine()
+            if GPE:
+                self.prompt_engine = GPE()
         
     async def load_model(self):
         self._ensure_services()
@@ -57,13 +92,32 @@ class ModelService:
             await self.provider_manager.initialize()
         self._loaded = True
     
+    async def cleanup(self):
+        if self.provider_manager:
+            await self.provider_manager.close()
+        self._loaded = False
+
     async def generate_response(self, prompt: str) -> str:
         return await self.generate_response_with_language(prompt, "en")
 
-    async def generate_response_with_language(self, prompt: str, language: str = "en") -> str:
+    async def generate_response_with_language(
+        self, prompt: str, language: str = "en", cache: bool = False
+    ) -> str:
+        """Generate a response; with cache=True, earlier answers may be reused."""
         if not self._loaded:
             raise RuntimeError("AI providers not initialized")
         
+        # Concurrent requests for the same prompt share one provider call
+        key = (prompt, language, cache)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._generate(prompt, language, cache))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shield so one caller being cancelled does not cancel the others
+        return await asyncio.shield(task)
+
+    async def _generate(self, prompt: str, language: str, cache: bool) -> str:
         try:
             self._ensure_services()
             # Generate optimized prompt if available
@@ -72,11 +126,13 @@ class ModelService:
             else:
                 enhanced_prompt = prompt
             
-            if self.provider_manager:
+            if self.provider_manager and cache:
+                response = await self._cached_generate(
+                    enhanced_prompt, MAX_TOKENS, TEMPERATURE
+                )
+            elif self.provider_manager:
                 response = await self.provider_manager.generate_response(
-                    enhanced_prompt, 
-                    max_tokens=200,
-                    temperature=0.7
+                    enhanced_prompt, max_tokens=MAX_TOKENS, temperature=TEMPERATURE
                 )
             else:
                 response = None
@@ -87,6 +143,69 @@ class ModelService:
             logger.error(f"Error generating response: {e}")
             return self._fallback_response(language)
     
+    def _cache_key(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        """Hash the prompt with the current provider and sampling settings."""
+        info = self.get_model_info()
+        payload = {
+            "provider": info.get("provider"),
+            "model": info.get("model"),
+            "prompt": prompt,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()
+
+    async def _cached_generate(
+        self, prompt: str, max_tokens: int, temperature: float
+    ) -> str:
+        """Ask the provider, reusing earlier answers for the same prompt."""
+        if temperature > MAX_CACHEABLE_TEMPERATURE:
+            return await self.provider_manager.generate_response(
+                prompt, max_tokens=max_tokens, temperature=temperature
+            )
+
+        # Resolve the provider first so the key never records a None provider
+        if self.get_model_info().get("provider") is None:
+            await self.provider_manager.initialize()
+
+        pool_size = RESPONSE_SAMPLE_POOL if temperature > 0 else 1
+        key = self._cache_key(prompt, max_tokens, temperature)
+        now = time.monotonic()
+        entry = self._response_cache.get(key)
+        if entry is not None and now - entry.created > RESPONSE_CACHE_TTL:
+            del self._response_cache[key]
+            entry = None
+
+        if entry is not None and len(entry.samples) >= pool_size:
+            self._response_cache.move_to_end(key)
+            sample = entry.samples[entry.next_index % len(entry.samples)]
+            entry.next_index += 1
+            return sample
+
+        response = await self.provider_manager.generate_response(
+            prompt, max_tokens=max_tokens, temperature=temperature
+        )
+        if response:
+            # The manager may have fallen back to another provider; store
+            # the answer under the provider that actually produced it
+            answered_key = self._cache_key(prompt, max_tokens, temperature)
+            if answered_key != key:
+                key = answered_key
+                entry = self._response_cache.get(key)
+                if entry is not None and now - entry.created > RESPONSE_CACHE_TTL:
+                    entry = None
+            if entry is None:
+                entry = _CachedResponses(created=now)
+                self._response_cache[key] = entry
+            if len(entry.samples) < pool_size:
+                entry.samples.append(response)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return response
+
     def _clean_response(self, response: str) -> str:
         """Clean and format response."""
         return response.strip()
@@ -0,0 +1,205 @@
+"""
+Tests for the /api/ai routes.
+"""
+
+import hashlib
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import ai, deps, files
+
+
+@pytest.fixture
+def ai_client():
+    """Create a test client for the AI router."""
+    app = FastAPI()
+    app.include_router(ai.router)
+    return TestClient(app)
+
+
+def test_process_document_accepts_pdf(ai_client: TestClient):
+    """PDF uploads with the PDF signature are processed."""
+    response = ai_client.post(
+        "/api/ai/process-document",
+        files={"file": ("guide.pdf", b"%PDF-1.7\n...", "application/pdf")},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["num_pages"] == 1
+
+
+def test_process_document_rejects_non_pdf_content(ai_client: TestClient):
+    """Files named .pdf without the PDF signature are rejected up front."""
+    response = ai_client.post(
+        "/api/ai/process-document",
+        files={"file": ("guide.pdf", b"MZ\x90\x00 not a pdf", "application/pdf")},
+    )
+
+    assert response.status_code == 415
+
+
+def test_process_document_rejects_empty_file(ai_client: TestClient):
+    """Empty uploads are reported as a client error."""
+    response = ai_client.post(
+        "/api/ai/process-document",
+        files={"file": ("guide.pdf", b"", "application/pdf")},
+    )
+
+    assert response.status_code == 400
+
+
+def test_text_to_speech_reuses_cached_audio(ai_client: TestClient, tmp_path, monkeypatch):
+    """Identical TTS requests are synthesized once and share one file."""
+    monkeypatch.setattr(ai, "TTS_AUDIO_DIR", tmp_path)
+    audio_service = MagicMock()
+    audio_service.is_tts_ready.return_value = True
+    audio_service.text_to_speech = AsyncMock(return_value=b"\x00" * 32000)
+    ai_client.app.dependency_overrides[deps.get_audio_service] = lambda: audio_service
+    payload = {"text": "Hello", "language": "en"}
+
+    first = ai_client.post("/api/ai/text-to-speech", json=payload)
+    second = ai_client.post("/api/ai/text-to-speech", json=payload)
+
+    assert first.status_code == second.status_code == 200
+    assert first.json()["audio_url"] == second.json()["audio_url"]
+    assert second.json()["duration"] == 1.0
+    audio_service.text_to_speech.assert_awaited_once()
+
+
+def test_text_to_speech_url_is_served_by_files_router(
+    ai_client: TestClient, tmp_path, monkeypatch
+):
+    """The returned audio_url downloads the synthesized file."""
+    monkeypatch.setattr(files.storage_service, "base_dir", tmp_path)
+    monkeypatch.setattr(ai, "TTS_AUDIO_DIR", tmp_path / "audio")
+    (tmp_path / "audio").mkdir()
+    audio_service = MagicMock()
+    audio_service.is_tts_ready.return_value = True
+    audio_service.text_to_speech = AsyncMock(return_value=b"RIFF" + b"\x00" * 60)
+    ai_client.app.dependency_overrides[deps.get_audio_service] = lambda: audio_service
+    ai_client.app.include_router(files.router)
+
+    response = ai_client.post("/api/ai/text-to-speech", json={"text": "Hello"})
+    audio = ai_client.get(response.json()["audio_url"])
+
+    assert audio.status_code == 200
+    assert audio.content == b"RIFF" + b"\x00" * 60
+
+
+def test_generate_batch_returns_results_in_order(ai_client: TestClient):
+    """Batch generation answers every prompt in request order."""
+    response = ai_client.post(
+        "/api/ai/generate/batch",
+        json={"prompts": [{"prompt": "first"}, {"prompt": "second"}]},
+    )
+
+    assert response.status_code == 200
+    texts = [item["generated_text"] for item in response.json()]
+    assert len(texts) == 2
+    assert "first" in texts[0] and "second" in texts[1]
+
+
+def test_batch_endpoints_cap_batch_size(ai_client: TestClient):
+    """Batches larger than MAX_BATCH_SIZE are rejected by validation."""
+    response = ai_client.post(
+        "/api/ai/detect-language/batch",
+        json={"texts": ["hello"] * (ai.MAX_BATCH_SIZE + 1)},
+    )
+
+    assert response.status_code == 422
+
+
+def test_transcription_response_types_segments():
+    """Segments are validated as typed models rather than free-form dicts."""
+    response = ai.TranscriptionResponse(
+        text="hello",
+        language="en",
+        confidence=0.9,
+        duration=1.5,
+        segments=[{"start": 0, "end": 1.5, "text": "hello", "confidence": 0.9}],
+    )
+
+    assert response.segments == [
+        ai.TranscriptSegment(start=0.0, end=1.5, text="hello", confidence=0.9)
+    ]
+
+
+def test_transcribe_returns_service_result(ai_client: TestClient):
+    """Transcriptions are returned as soon as the service finishes."""
+    audio_service = MagicMock()
+    audio_service.is_ready.return_value = True
+    audio_service.transcribe_upload_file = AsyncMock(return_value={
+        "text": "hello",
+        "language": "en",
+        "confidence": 0.9,
+        "duration": 1.0,
+        "segments": [],
+        "filename": "clip.wav",
+    })
+    ai_client.app.dependency_overrides[deps.get_audio_service] = lambda: audio_service
+
+    response = ai_client.post(
+        "/api/ai/transcribe",
+        files={"file": ("clip.wav", b"RIFF....", "audio/wav")},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["text"] == "hello"
+
+
+def test_process_documents_handles_multiple_files(ai_client: TestClient):
+    """Several PDFs are processed in one request, in upload order."""
+    response = ai_client.post(
+        "/api/ai/process-documents",
+        files=[
+            ("files", ("a.pdf", b"%PDF-1.7\n...", "application/pdf")),
+            ("files", ("b.pdf", b"%PDF-1.4\n...", "application/pdf")),
+        ],
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+
+def test_process_documents_rejects_any_non_pdf(ai_client: TestClient):
+    """One invalid file fails the whole batch with its own status code."""
+    response = ai_client.post(
+        "/api/ai/process-documents",
+        files=[
+            ("files", ("a.pdf", b"%PDF-1.7\n...", "application/pdf")),
+            ("files", ("b.pdf", b"not a pdf", "application/pdf")),
+        ],
+    )
+
+    assert response.status_code == 415
+
+
+@pytest.mark.parametrize(
+    "text, language",
+    [
+        ("What is consent?", "en"),
+        ("什么是知情同意？", "zh"),
+        ("我想了解 HPV 疫苗", "zh"),
+        ("HIV是什么?", "zh"),
+        ("HPV疫苗", "zh"),
+        ("什么是HPV", "zh"),
+    ],
+)
+def test_detect_language_classifies_by_script(ai_client: TestClient, text, language):
+    """Chinese and English text are told apart by their characters."""
+    response = ai_client.post("/api/ai/detect-language", json={"text": text})
+
+    assert response.status_code == 200
+    assert response.json()["language"] == language
+
+
+def test_tts_filename_is_keyed_with_secret(monkeypatch):
+    """TTS file names cannot be derived from the text alone."""
+    name = ai._tts_filename("Hello", "en", None)
+    monkeypatch.setattr(ai.settings, "SECRET_KEY", "another-secret")
+
+    assert ai._tts_filename("Hello", "en", None) != name
+    assert hashlib.sha256(b'["Hello", "en", null]').hexdigest() not in name
@@ -0,0 +1,82 @@
+"""
+Tests for the audio streaming WebSocket endpoint.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import audio_streaming
+
+
+@pytest.fixture
+def streaming_service():
+    """Create a mock streaming service."""
+    service = MagicMock()
+    service.connect_websocket = AsyncMock()
+    service.disconnect_websocket = AsyncMock()
+    service.process_audio_stream = AsyncMock(return_value="chunk-1")
+    return service
+
+
+@pytest.fixture
+def streaming_client(streaming_service):
+    """Create a test client for the audio streaming router."""
+    app = FastAPI()
+    app.include_router(audio_streaming.router, prefix="/audio-streaming")
+    app.dependency_overrides[audio_streaming.get_streaming_service] = (
+        lambda: streaming_service
+    )
+    return TestClient(app)
+
+
+def test_binary_audio_frame_uses_preceding_header(streaming_client, streaming_service):
+    """Binary frames are raw audio; the JSON header supplies chunk metadata."""
+    with streaming_client.websocket_connect("/audio-streaming/ws/session-1") as ws:
+        assert json.loads(ws.receive_text())["type"] == "connection_established"
+
+        ws.send_text(json.dumps({
+            "type": "audio_chunk",
+            "data": {"is_final": True, "chunk_index": 3},
+        }))
+        ws.send_bytes(b"\x00\x01\x02\x03")
+        ack = json.loads(ws.receive_text())
+
+    assert ack["type"] == "chunk_received"
+    assert (ack["chunk_index"], ack["size"], ack["is_final"]) == (3, 4, True)
+    streaming_service.process_audio_stream.assert_awaited_once_with(
+        "session-1", b"\x00\x01\x02\x03", True
+    )
+
+
+def test_hex_audio_chunk_is_still_accepted(streaming_client, streaming_service):
+    """Clients sending hex-encoded audio in JSON keep working."""
+    with streaming_client.websocket_connect("/audio-streaming/ws/session-1") as ws:
+        ws.receive_text()
+        ws.send_text(json.dumps({
+            "type": "audio_chunk",
+            "data": {"audio_data": "00010203", "chunk_index": 0},
+        }))
+        ack = json.loads(ws.receive_text())
+
+    assert ack["size"] == 4
+    streaming_service.process_audio_stream.assert_awaited_once_with(
+        "session-1", b"\x00\x01\x02\x03", False
+    )
+
+
+def test_invalid_json_frame_reports_error(streaming_client):
+    """Malformed text frames get an error reply and the socket stays open."""
+    with streaming_client.websocket_connect("/audio-streaming/ws/session-1") as ws:
+        ws.receive_text()
+        ws.send_text("{not json")
+        error = json.loads(ws.receive_text())
+        ws.send_text(json.dumps({"type": "control", "data": {"command": "ping"}}))
+        pong = json.loads(ws.receive_text())
+
+    assert error["type"] == "error"
+    assert error["message"].startswith("Invalid JSON format")
+    assert pong["type"] == "pong"
@@ -0,0 +1,61 @@
+"""
+Tests for the file management routes.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import files
+from app.core import storage
+
+
+@pytest.fixture
+def files_client(tmp_path, monkeypatch):
+    """Create a test client whose storage lives in a temp directory."""
+    monkeypatch.setattr(files.storage_service, "temp_dir", tmp_path)
+    monkeypatch.setattr(
+        files.storage_service,
+        "get_file_path",
+        lambda filename, file_type="temp": tmp_path / filename,
+    )
+    app = FastAPI()
+    app.include_router(files.router)
+    return TestClient(app), tmp_path
+
+
+def test_get_file_returns_file_contents(files_client):
+    """Stored files are served with their size and contents."""
+    client, storage_dir = files_client
+    (storage_dir / "note.txt").write_bytes(b"hello")
+
+    response = client.get("/api/files/temp/note.txt")
+
+    assert response.status_code == 200
+    assert response.content == b"hello"
+    assert response.headers["content-length"] == "5"
+
+
+def test_get_file_missing_returns_404(files_client):
+    """Missing files are reported as not found rather than a server error."""
+    client, _ = files_client
+
+    response = client.get("/api/files/temp/missing.txt")
+
+    assert response.status_code == 404
+
+
+def test_upload_file_reports_written_size(files_client, monkeypatch):
+    """Uploads are written in chunks and report the bytes written."""
+    client, storage_dir = files_client
+    monkeypatch.setattr(storage, "UPLOAD_CHUNK_SIZE", 1024)
+
+    response = client.post(
+        "/api/files/upload",
+        files={"file": ("note.txt", b"x" * 3000, "text/plain")},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["size"] == 3000
+    assert (storage_dir / body["filename"]).read_bytes() == b"x" * 3000
@@ -55,6 +55,13 @@ def test_allowed_extensions():
     assert ".txt" in settings.ALLOWED_EXTENSIONS
 
 
+def test_allowed_extensions_are_normalized():
+    """Configured extensions become a lower-cased frozenset."""
+    settings = Settings(ALLOWED_EXTENSIONS={".PDF", ".Wav"})
+
+    assert settings.ALLOWED_EXTENSIONS == frozenset({".pdf", ".wav"})
+
+
 def test_upload_settings():
     """Test upload-related settings."""
     settings = Settings()
@@ -0,0 +1,51 @@
+"""
+Tests for the service dependency providers.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core import dependencies
+
+
+@pytest.fixture(autouse=True)
+def reset_services(monkeypatch):
+    """Start each test without registered services."""
+    monkeypatch.setattr(dependencies, "_ai_service", None)
+    monkeypatch.setattr(dependencies, "_audio_service", None)
+    monkeypatch.setattr(dependencies, "_document_service", None)
+
+
+@pytest.mark.parametrize(
+    "getter",
+    [
+        dependencies.get_ai_service,
+        dependencies.get_audio_service,
+        dependencies.get_document_service,
+    ],
+)
+def test_fallback_service_is_built_once(getter):
+    """Without a registered service, every request gets the same instance."""
+    assert getter() is getter()
+
+
+def test_set_services_registers_all_services():
+    """set_services makes the startup instances visible to the getters."""
+    ai_service, audio_service, document_service = MagicMock(), MagicMock(), MagicMock()
+
+    dependencies.set_services(ai_service, audio_service, document_service)
+
+    assert dependencies.get_ai_service() is ai_service
+    assert dependencies.get_audio_service() is audio_service
+    assert dependencies.get_document_service() is document_service
+
+
+def test_get_ai_model_shares_the_registered_ai_service():
+    """The v1 AI endpoints use the same AIService as the rest of the app."""
+    from app.core.ai import get_ai_model
+
+    ai_service = MagicMock()
+    dependencies.set_ai_service(ai_service)
+
+    assert get_ai_model() is ai_service
@@ -73,3 +73,33 @@ def test_desktop_requirements_exclude_local_ml_stack():
 
     for package_name in excluded:
         assert package_name not in requirements
+
+
+def test_desktop_chat_closes_provider_manager(monkeypatch):
+    """Per-request provider managers release their HTTP pools."""
+    from app import desktop_main
+
+    managers = []
+
+    class FakeManager:
+        def __init__(self):
+            self.closed = False
+            managers.append(self)
+
+        async def generate_response(self, prompt, **kwargs):
+            return "Condoms reduce STI risk."
+
+        async def close(self):
+            self.closed = True
+
+    monkeypatch.setattr(desktop_main.ai_providers, "AIProviderManager", FakeManager)
+    client = TestClient(desktop_main.app)
+
+    response = client.post(
+        "/api/v1/chat",
+        json={"message": "Do condoms prevent STI?", "language": "en"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "answered"
+    assert managers and all(manager.closed for manager in managers)
@@ -110,12 +110,18 @@ def test_is_ready(ai_service):
     assert ai_service.is_ready() is True
 
 
-def test_get_supported_languages(ai_service):
-    """Test get supported languages."""
-    languages = ai_service.get_supported_languages()
-    assert isinstance(languages, list)
-    assert "en" in languages
-    assert "zh-CN" in languages
+@pytest.mark.parametrize(
+    "getter, expected",
+    [
+        ("get_supported_languages", {"en", "zh-CN"}),
+        ("get_available_topics", {"anatomy", "contraception", "consent_education"}),
+    ],
+)
+def test_service_catalog(ai_service, getter, expected):
+    """Test supported languages and available topics listings."""
+    values = getattr(ai_service, getter)()
+    assert isinstance(values, list)
+    assert expected <= set(values)
 
 
 def test_get_model_info(ai_service):
@@ -157,12 +163,3 @@ async def test_generate_fallback_response_uses_source_backed_chinese_prompt(ai_s
     prompt = ai_service.model_service.generate_response_with_language.call_args.args[0]
     assert "已提供的资料" in prompt
     assert response["language"] == "zh-CN"
-
-
-def test_get_available_topics(ai_service):
-    """Test get available topics."""
-    topics = ai_service.get_available_topics()
-    assert isinstance(topics, list)
-    assert "anatomy" in topics
-    assert "contraception" in topics
-    assert "consent_education" in topics
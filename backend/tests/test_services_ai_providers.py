@@ -1,5 +1,7 @@
 """Tests for AI provider fallback behavior."""
 
+import asyncio
+
 import pytest
 
 from services import ai_providers
@@ -78,6 +80,46 @@ def clear_provider_env(monkeypatch):
     ai_providers.clear_desktop_provider_credentials()
 
 
+class FakeProviderManager:
+    """Provider manager stand-in whose answers come from a test callback."""
+
+    def __init__(self, generate):
+        self._generate = generate
+        self.provider = "fake"
+        self.calls = []
+
+    def get_provider_info(self):
+        return {"provider": self.provider, "model": "fake-model"}
+
+    async def initialize(self):
+        self.provider = self.provider or "fake"
+
+    async def generate_response(self, prompt, **kwargs):
+        self.calls.append(prompt)
+        return await self._generate(self, prompt)
+
+
+class PassthroughPrompts:
+    """Prompt engine stand-in that leaves prompts unchanged."""
+
+    def enhance_response_quality(self, prompt):
+        return prompt
+
+
+@pytest.fixture
+def model_service():
+    """Build a loaded ModelService around a FakeProviderManager."""
+
+    def build(generate):
+        service = ModelService()
+        service.provider_manager = FakeProviderManager(generate)
+        service.prompt_engine = PassthroughPrompts()
+        service._loaded = True
+        return service
+
+    return build
+
+
 def test_provider_catalog_uses_current_defaults_without_secrets():
     """Provider catalog exposes current model defaults, not credentials."""
     catalog = ai_providers.get_provider_catalog()
@@ -127,6 +169,27 @@ async def test_mistral_provider_posts_chat_completion_request():
     }
 
 
+@pytest.mark.asyncio
+async def test_provider_reuses_pooled_http_client():
+    """Providers keep one HTTP client across availability checks and requests."""
+    FakeAsyncClient.responses = [
+        FakeResponse(200, {"data": []}),
+        FakeResponse(
+            200,
+            {"choices": [{"message": {"content": "Hello from Mistral"}}]},
+        ),
+    ]
+    provider = MistralProvider(api_key="mistral-key")
+
+    assert await provider.is_available() is True
+    client = provider._client
+    await provider.generate_response("Say hello")
+
+    assert client is not None
+    assert provider._client is client
+    assert len(FakeAsyncClient.requests) == 2
+
+
 def test_provider_manager_prefers_desktop_credentials_over_environment(monkeypatch):
     """Desktop BYOK credentials override process-level environment values."""
     monkeypatch.setenv("OPENAI_API_KEY", "env-openai-key")
@@ -302,3 +365,99 @@ def test_model_service_includes_provider_metadata():
         "model": "openai/gpt-4.1",
         "available_providers": ["github"],
     }
+
+
+async def numbered_answer(manager, prompt):
+    return f"sample {len(manager.calls)}"
+
+
+@pytest.mark.asyncio
+async def test_model_service_coalesces_identical_concurrent_prompts(model_service):
+    """Identical prompts in flight at the same time share one provider call."""
+
+    async def slow_answer(manager, prompt):
+        await asyncio.sleep(0.01)
+        return f"answer to {prompt}"
+
+    service = model_service(slow_answer)
+
+    results = await asyncio.gather(
+        service.generate_response("same"),
+        service.generate_response("same"),
+        service.generate_response("other"),
+    )
+
+    assert results == ["answer to same", "answer to same", "answer to other"]
+    assert sorted(service.provider_manager.calls) == ["other", "same"]
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_model_service_serves_cached_samples_for_repeated_prompts(model_service):
+    """Repeated prompts fill a small sample pool, then rotate through it."""
+    service = model_service(numbered_answer)
+    calls = service.provider_manager.calls
+
+    results = [
+        await service._cached_generate("same", 200, 0.7) for _ in range(5)
+    ]
+
+    assert len(calls) == 3
+    assert results == ["sample 1", "sample 2", "sample 3", "sample 1", "sample 2"]
+    assert await service._cached_generate("same", 200, 0.0) == "sample 4"
+    assert await service._cached_generate("same", 200, 0.0) == "sample 4"
+    assert len(calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_model_service_only_caches_when_asked(model_service):
+    """Callers that do not opt in always get a fresh provider answer."""
+    service = model_service(numbered_answer)
+
+    assert await service.generate_response("same") == "sample 1"
+    assert await service.generate_response("same") == "sample 2"
+    assert not service._response_cache
+
+    await service.generate_response_with_language("same", "en", cache=True)
+    assert len(service._response_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_model_service_caches_fallback_answers_under_answering_provider(
+    model_service,
+):
+    """A fallback answer is stored under the provider that produced it."""
+
+    async def fall_back(manager, prompt):
+        manager.provider = "backup"
+        return "backup answer"
+
+    service = model_service(fall_back)
+    service.provider_manager.provider = "primary"
+
+    await service._cached_generate("same", 200, 0.0)
+
+    assert service._cache_key("same", 200, 0.0) in service._response_cache
+    service.provider_manager.provider = "primary"
+    assert service._cache_key("same", 200, 0.0) not in service._response_cache
+
+
+@pytest.mark.asyncio
+async def test_model_service_resolves_provider_before_keying_cache(model_service):
+    """The cache lookup is keyed on a resolved provider, never on None."""
+    seen_keys = []
+    service = model_service(numbered_answer)
+    service.provider_manager.provider = None
+    cache_key = service._cache_key
+
+    def recording_cache_key(*args):
+        key = cache_key(*args)
+        seen_keys.append(service.get_model_info()["provider"])
+        return key
+
+    service._cache_key = recording_cache_key
+
+    await service._cached_generate("same", 200, 0.0)
+
+    assert seen_keys and None not in seen_keys
+    assert await service._cached_generate("same", 200, 0.0) == "sample 1"
@@ -2,10 +2,16 @@
 Tests for audio service functionality.
 """
 
+import io
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
 
+from fastapi import UploadFile
+
+from app.config import settings
+from app.core.exceptions import AudioFormatException
 from app.services.audio_service import AudioService
 
 
@@ -78,4 +84,68 @@ async def test_transcribe_audio_not_initialized(audio_service):
     mock_file = MagicMock()
     
     with pytest.raises(Exception):  # More flexible exception matching
-        await audio_service.transcribe_audio(b'fake data')
\ No newline at end of file
+        await audio_service.transcribe_audio(b'fake data')
+
+
+@pytest.mark.asyncio
+async def test_transcribe_upload_file_streams_to_temp_file(audio_service):
+    """Uploads are copied to a temp file in chunks and removed afterwards."""
+    audio_service.is_initialized = True
+    audio_service.whisper_model = MagicMock()
+    upload = UploadFile(file=io.BytesIO(b"x" * 2500), filename="clip.wav")
+    seen = {}
+
+    def fake_transcribe(path, language=None, task="transcribe"):
+        seen["path"] = path
+        seen["data"] = Path(path).read_bytes()
+        return {"text": "Hello world", "language": "en"}
+
+    with patch("app.services.audio_service.UPLOAD_CHUNK_SIZE", 1024), \
+            patch.object(audio_service, "_transcribe_file", side_effect=fake_transcribe):
+        result = await audio_service.transcribe_upload_file(upload, "en")
+
+    assert result["filename"] == "clip.wav"
+    assert seen["data"] == b"x" * 2500
+    assert not Path(seen["path"]).exists()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_upload_file_rejects_oversized_upload(audio_service):
+    """Oversized uploads are rejected once the limit is crossed."""
+    audio_service.is_initialized = True
+    audio_service.whisper_model = MagicMock()
+    upload = UploadFile(file=io.BytesIO(b"x" * 4096), filename="clip.wav")
+
+    with patch("app.services.audio_service.UPLOAD_CHUNK_SIZE", 1024), \
+            patch.object(settings, "max_file_size", 2048), \
+            patch.object(audio_service, "_transcribe_file") as mock_transcribe:
+        with pytest.raises(AudioFormatException):
+            await audio_service.transcribe_upload_file(upload)
+
+    mock_transcribe.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_upload_file_reuses_result_for_identical_audio(audio_service):
+    """Uploading the same audio twice runs Whisper only once."""
+    audio_service.is_initialized = True
+    audio_service.whisper_model = MagicMock()
+
+    with patch.object(
+        audio_service,
+        "_transcribe_file",
+        side_effect=lambda *args, **kwargs: {"text": "Hello world", "language": "en"},
+    ) as mock_transcribe:
+        first = await audio_service.transcribe_upload_file(
+            UploadFile(file=io.BytesIO(b"same audio"), filename="a.wav"), "en"
+        )
+        second = await audio_service.transcribe_upload_file(
+            UploadFile(file=io.BytesIO(b"same audio"), filename="b.wav"), "en"
+        )
+        await audio_service.transcribe_upload_file(
+            UploadFile(file=io.BytesIO(b"other audio"), filename="c.wav"), "en"
+        )
+
+    assert mock_transcribe.call_count == 2
+    assert first["text"] == second["text"] == "Hello world"
+    assert (first["filename"], second["filename"]) == ("a.wav", "b.wav")
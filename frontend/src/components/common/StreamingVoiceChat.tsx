@@ -428,25 +428,20 @@ const StreamingVoiceChat = forwardRef<StreamingVoiceChatRef, StreamingVoiceChatP
     }
 
     try {
-      // Convert ArrayBuffer to hex string (optimized)
       const audioData = await chunk.data;
-      const uint8Array = new Uint8Array(audioData);
-      let hexString = '';
-      for (let i = 0; i < uint8Array.length; i++) {
-        hexString += uint8Array[i].toString(16).padStart(2, '0');
-      }
 
-      const message = {
+      // Send a JSON header, then the raw audio as a binary frame
+      const header = {
         type: "audio_chunk",
         data: {
-          audio_data: hexString,
           is_final: chunk.isFinal,
           chunk_index: chunk.index,
         },
         timestamp: chunk.timestamp,
       };
 
-      session.websocket.send(JSON.stringify(message));
+      session.websocket.send(JSON.stringify(header));
+      session.websocket.send(audioData);
 
     } catch (error) {
       console.error("Error sending audio chunk:", error);